@@ -4,7 +4,7 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
@@ -15,6 +15,10 @@ import sqlite3
 import asyncio
 from enum import Enum
 import hashlib
+from collections import Counter, namedtuple
+from functools import lru_cache
+from operator import attrgetter
+from bisect import bisect_right
 import math  # Added for debt calculations
 import traceback
 import logging
@@ -28,6 +32,14 @@ from pdf_report_generator import generate_financial_report
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@st.cache_resource(show_spinner=False)
+def _get_rng():
+    """Seeded PCG64 generator for simulated chart noise, created once per server process"""
+    return np.random.default_rng(42)
+
+# Shared across reruns and drawn in batches instead of per point
+_rng = _get_rng()
+
 def safe_execute(func, fallback=None, error_message="An error occurred"):
     """Safely execute a function with error handling"""
     try:
@@ -176,6 +188,36 @@ st.markdown("""
         border-radius: 10px;
         transition: width 0.5s ease;
     }
+    
+    .impact-card {
+        padding: 1.5rem;
+        border-radius: 15px;
+        text-align: center;
+        color: white;
+    }
+    
+    .sub-good, .sub-bad {
+        padding: 1rem;
+        border-radius: 10px;
+        margin: 0.4rem 0;
+        color: white;
+        box-shadow: 0 3px 8px rgba(0,0,0,0.1);
+    }
+    
+    .sub-good {
+        background: linear-gradient(135deg, #51cf66 0%, #40c057 100%);
+    }
+    
+    .sub-bad {
+        background: linear-gradient(135deg, #ff6b6b 0%, #ff5252 100%);
+    }
+    
+    .page-banner {
+        padding: 2rem;
+        border-radius: 20px;
+        margin-bottom: 2rem;
+        text-align: center;
+    }
 </style>
 """, unsafe_allow_html=True)
 
@@ -365,6 +407,11 @@ class SmartFinanceAgent:
 # CURRENCY FORMATTING HELPERS
 # =============================================================================
 
+@lru_cache(maxsize=2048)
+def _fmt(value: float, decimals: int, symbol: str) -> str:
+    """Render a converted amount with its currency symbol"""
+    return f"{symbol}{value:,.{decimals}f}"
+
 def format_currency(amount, decimals=2):
     """Safely format currency with error handling"""
     try:
@@ -376,12 +423,8 @@ def format_currency(amount, decimals=2):
         rate = currency_rates.get(currency_code, 1.0)
         value = float(amount) * rate
         
-        if currency_code == 'INR':
-            return f"₹{value:,.{decimals}f}"
-        elif currency_code == 'EUR':
-            return f"€{value:,.{decimals}f}"
-        else:  # USD
-            return f"${value:,.{decimals}f}"
+        # Cards repeat the same handful of amounts, so memoize on the exact value
+        return _fmt(value, decimals, symbol)
     except (ValueError, TypeError, KeyError) as e:
         logger.warning(f"Currency formatting error: {str(e)}")
         return f"${float(amount or 0):,.{decimals}f}"
@@ -1048,6 +1091,8 @@ if st.session_state.budget_plan and not is_tier2_page:
         'Percentage': [budget.needs_percentage, budget.wants_percentage, budget.savings_percentage]
     }
     
+    # plotly.express is only needed for this pie, so it's imported once a budget plan exists
+    import plotly.express as px
     fig_budget = px.pie(
         values=budget_data['Amount'],
         names=budget_data['Category'],
@@ -1978,8 +2023,10 @@ if st.session_state.transactions:
 # Spending Personality Profile
 st.markdown("### 🧬 Your Spending Personality")
 if st.session_state.transactions:
-    planned_count = len([t for t in st.session_state.transactions if analyze_transaction_context(t)["impulse_score"] < 40])
-    impulse_count = len([t for t in st.session_state.transactions if analyze_transaction_context(t)["impulse_score"] >= 70])
+    # Score each transaction once; the counts are generator sums, not filtered lists
+    impulse_scores = [analyze_transaction_context(t)["impulse_score"] for t in st.session_state.transactions]
+    planned_count = sum(1 for score in impulse_scores if score < 40)
+    impulse_count = sum(1 for score in impulse_scores if score >= 70)
     total = len(st.session_state.transactions)
     
     planned_percent = (planned_count / total * 100) if total > 0 else 0
@@ -2032,6 +2079,12 @@ if st.session_state.transactions:
 
 st.markdown("## 🎬 Budget Profiles - Choose Your Mode")
 
+# Single wall-clock snapshot shared by the budget, forecast, impulse and blueprint sections
+_NOW = datetime.now()
+_NOW_DATE = _NOW.date()
+_NOW_MONTH = _NOW.month
+_NOW_DAY = _NOW.day
+
 # Budget persona definitions
 budget_personas = {
     "Student Mode 📚": {
@@ -2078,68 +2131,94 @@ budget_personas = {
     }
 }
 
+# Seasonal persona suggestions keyed by calendar month
+_SEASONAL = {
+    11: ("Holiday Mode 🎄", "December detected! Switch to Holiday Mode?"),
+    12: ("Holiday Mode 🎄", "December detected! Switch to Holiday Mode?"),
+    1: ("Wealth Builder 🚀", "New Year's Resolution time! Go aggressive?"),
+}
+
 # Initialize selected persona
 if 'selected_budget_persona' not in st.session_state:
     st.session_state.selected_budget_persona = "Balanced Mode ⚖️"
+if 'persona_seg' not in st.session_state:
+    st.session_state.persona_seg = st.session_state.selected_budget_persona
+
+def _apply_persona(persona_name):
+    """Button callback: switch persona before the rerun so the selector follows"""
+    st.session_state.selected_budget_persona = persona_name
+    st.session_state.persona_seg = persona_name
+
+def _on_persona_seg():
+    """Selector callback: adopt the picked persona, or reselect the current one if it was clicked off"""
+    if st.session_state.persona_seg is None:
+        st.session_state.persona_seg = st.session_state.selected_budget_persona
+    else:
+        st.session_state.selected_budget_persona = st.session_state.persona_seg
 
 # Display persona cards
 st.markdown("### 🎯 Swipe to Choose Your Budget Personality")
 
-cols = st.columns(3)
-for i, (persona_name, persona) in enumerate(budget_personas.items()):
-    with cols[i % 3]:
-        is_selected = st.session_state.selected_budget_persona == persona_name
-        border_style = f"4px solid {persona['color']}" if is_selected else "2px solid #e0e0e0"
-        bg_opacity = "1" if is_selected else "0.7"
-        
-        st.markdown(f"""
-        <div style='
-            background: linear-gradient(135deg, {persona["color"]}30, {persona["color"]}10);
-            border: {border_style};
-            padding: 1.5rem;
-            border-radius: 15px;
-            margin: 8px 0;
-            opacity: {bg_opacity};
-            cursor: pointer;
-            transition: all 0.3s;
-            min-height: 220px;
-            display: flex;
-            flex-direction: column;
-            justify-content: space-between;
-        '>
-            <div style='text-align: center;'>
-                <span style='font-size: 2.5rem; display: block; margin-bottom: 8px;'>{persona["icon"]}</span>
-                <h4 style='margin: 0 0 8px 0; color: #FFFFFF; font-size: 1.2rem; font-weight: 700; word-wrap: break-word; overflow-wrap: break-word; text-shadow: 0 2px 4px rgba(0,0,0,0.3);'>{persona_name}</h4>
-                <p style='margin: 0; font-size: 0.9rem; color: #E8E8E8; line-height: 1.3;'>{persona["description"]}</p>
+st.segmented_control(
+    "Pick your mode",
+    options=list(budget_personas.keys()),
+    key="persona_seg",
+    on_change=_on_persona_seg
+)
+
+# Persona cards are informational only, so render the whole grid in one blob
+persona_cards = []
+for persona_name, persona in budget_personas.items():
+    is_selected = st.session_state.selected_budget_persona == persona_name
+    border_style = f"4px solid {persona['color']}" if is_selected else "2px solid #e0e0e0"
+    bg_opacity = "1" if is_selected else "0.7"
+    
+    persona_cards.append(f"""
+    <div style='
+        background: linear-gradient(135deg, {persona["color"]}30, {persona["color"]}10);
+        border: {border_style};
+        padding: 1.5rem;
+        border-radius: 15px;
+        margin: 8px 0;
+        opacity: {bg_opacity};
+        transition: all 0.3s;
+        min-height: 220px;
+        display: flex;
+        flex-direction: column;
+        justify-content: space-between;
+    '>
+        <div style='text-align: center;'>
+            <span style='font-size: 2.5rem; display: block; margin-bottom: 8px;'>{persona["icon"]}</span>
+            <h4 style='margin: 0 0 8px 0; color: #FFFFFF; font-size: 1.2rem; font-weight: 700; word-wrap: break-word; overflow-wrap: break-word; text-shadow: 0 2px 4px rgba(0,0,0,0.3);'>{persona_name}</h4>
+            <p style='margin: 0; font-size: 0.9rem; color: #E8E8E8; line-height: 1.3;'>{persona["description"]}</p>
+        </div>
+        <div style='display: flex; justify-content: space-around; margin-top: 15px; gap: 8px;'>
+            <div style='text-align: center; flex: 1;'>
+                <small style='color: {persona["color"]}; font-weight: 600;'>Needs</small>
+                <p style='margin: 4px 0; font-weight: bold; font-size: 1.1rem;'>{persona["needs"]}%</p>
             </div>
-            <div style='display: flex; justify-content: space-around; margin-top: 15px; gap: 8px;'>
-                <div style='text-align: center; flex: 1;'>
-                    <small style='color: {persona["color"]}; font-weight: 600;'>Needs</small>
-                    <p style='margin: 4px 0; font-weight: bold; font-size: 1.1rem;'>{persona["needs"]}%</p>
-                </div>
-                <div style='text-align: center; flex: 1;'>
-                    <small style='color: {persona["color"]}; font-weight: 600;'>Wants</small>
-                    <p style='margin: 4px 0; font-weight: bold; font-size: 1.1rem;'>{persona["wants"]}%</p>
-                </div>
-                <div style='text-align: center; flex: 1;'>
-                    <small style='color: {persona["color"]}; font-weight: 600;'>Save</small>
-                    <p style='margin: 4px 0; font-weight: bold; font-size: 1.1rem;'>{persona["savings"]}%</p>
-                </div>
+            <div style='text-align: center; flex: 1;'>
+                <small style='color: {persona["color"]}; font-weight: 600;'>Wants</small>
+                <p style='margin: 4px 0; font-weight: bold; font-size: 1.1rem;'>{persona["wants"]}%</p>
+            </div>
+            <div style='text-align: center; flex: 1;'>
+                <small style='color: {persona["color"]}; font-weight: 600;'>Save</small>
+                <p style='margin: 4px 0; font-weight: bold; font-size: 1.1rem;'>{persona["savings"]}%</p>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
-        if st.button(f"Select {persona['icon']}", key=f"persona_{i}", use_container_width=True):
-            st.session_state.selected_budget_persona = persona_name
-            st.rerun()
+    </div>
+""")
+
+st.markdown(
+    "<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 0 16px;'>"
+    + "".join(card.strip() for card in persona_cards)
+    + "</div>",
+    unsafe_allow_html=True
+)
 
 # Seasonal Auto-Switch Suggestion
-current_month = datetime.now().month
-seasonal_suggestion = None
-if current_month in [11, 12]:
-    seasonal_suggestion = ("Holiday Mode 🎄", "December detected! Switch to Holiday Mode?")
-elif current_month == 1:
-    seasonal_suggestion = ("Wealth Builder 🚀", "New Year's Resolution time! Go aggressive?")
+current_month = _NOW_MONTH
+seasonal_suggestion = _SEASONAL.get(current_month)
 
 # Show active budget breakdown based on selected mode
 selected_persona = budget_personas[st.session_state.selected_budget_persona]
@@ -2216,9 +2295,7 @@ if seasonal_suggestion and st.session_state.selected_budget_persona != seasonal_
         </div>
     </div>
     """, unsafe_allow_html=True)
-    if st.button("🔄 Switch Now", key="seasonal_switch"):
-        st.session_state.selected_budget_persona = seasonal_suggestion[0]
-        st.rerun()
+    st.button("🔄 Switch Now", key="seasonal_switch", on_click=_apply_persona, args=(seasonal_suggestion[0],))
 
 # =============================================================================
 # 🔥 TIER 1 FEATURE: PREDICTIVE END-OF-MONTH BALANCE
@@ -2237,12 +2314,12 @@ if st.session_state.financial_profile and st.session_state.transactions:
     else:
         daily_spend_rate = monthly_income / 30 * 0.8  # Assume 80% spend rate
     
-    current_day = datetime.now().day
+    current_day = _NOW_DAY
     days_remaining = 30 - current_day
     
     # Starting balance (assuming we start with income)
     starting_balance = monthly_income
-    current_spent = sum(t.amount for t in st.session_state.transactions if t.date.month == datetime.now().month)
+    current_spent = sum(t.amount for t in st.session_state.transactions if t.date.month == _NOW_MONTH)
     current_balance = starting_balance - current_spent
     
     # Predicted end-of-month balance
@@ -2331,11 +2408,14 @@ if st.session_state.financial_profile and st.session_state.transactions:
     
     # Trajectory chart
     if trajectory_data:
-        df_trajectory = pd.DataFrame(trajectory_data)
-        fig_trajectory = px.line(
-            df_trajectory, x="Day", y="Balance",
+        df_trajectory = pd.DataFrame.from_records(trajectory_data, columns=["Day", "Balance", "Status"])
+        fig_trajectory = go.Figure(data=go.Scatter(
+            x=df_trajectory["Day"].values, y=df_trajectory["Balance"].values,
+            mode="lines", line_color="#667eea"
+        ))
+        fig_trajectory.update_layout(
             title="💰 Balance Trajectory This Month",
-            color_discrete_sequence=['#667eea']
+            xaxis_title="Day", yaxis_title="Balance"
         )
         fig_trajectory.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="Danger Zone")
         fig_trajectory.add_hline(y=monthly_income * 0.1, line_dash="dot", line_color="orange", annotation_text="Warning")
@@ -2400,28 +2480,35 @@ st.markdown("## ⚡ Impulse Control Center")
 if 'impulse_streak' not in st.session_state:
     st.session_state.impulse_streak = 0
 if 'last_impulse_check' not in st.session_state:
-    st.session_state.last_impulse_check = datetime.now().date()
+    st.session_state.last_impulse_check = _NOW_DATE
 
 # Reset streak if new day
-if datetime.now().date() != st.session_state.last_impulse_check:
-    st.session_state.last_impulse_check = datetime.now().date()
+if _NOW_DATE != st.session_state.last_impulse_check:
+    st.session_state.last_impulse_check = _NOW_DATE
 
 # Calculate overall impulse metrics
 if st.session_state.transactions:
     impulse_data = []
+    impulse_count = planned_count = 0
+    impulse_amount = planned_amount = 0
     for t in st.session_state.transactions:
         analysis = analyze_transaction_context(t)
+        score = analysis["impulse_score"]
+        is_impulse = score >= 70
         impulse_data.append({
             "transaction": t,
-            "score": analysis["impulse_score"],
-            "is_impulse": analysis["impulse_score"] >= 70
+            "score": score,
+            "is_impulse": is_impulse
         })
+        # Tally counts and totals in the same pass
+        if is_impulse:
+            impulse_count += 1
+            impulse_amount += t.amount
+        elif score < 40:
+            planned_count += 1
+            planned_amount += t.amount
     
     total_transactions = len(impulse_data)
-    impulse_count = len([d for d in impulse_data if d["is_impulse"]])
-    planned_count = len([d for d in impulse_data if d["score"] < 40])
-    impulse_amount = sum(d["transaction"].amount for d in impulse_data if d["is_impulse"])
-    planned_amount = sum(d["transaction"].amount for d in impulse_data if d["score"] < 40)
     
     impulse_ratio = (impulse_count / total_transactions * 100) if total_transactions > 0 else 0
     discipline_score = 100 - impulse_ratio
@@ -2494,23 +2581,27 @@ if st.session_state.transactions:
     st.markdown("### 📊 When Are You Most Impulsive?")
     
     # Analyze by time
-    morning_impulses = len([d for d in impulse_data if d["is_impulse"] and 6 <= d["transaction"].date.hour < 12])
-    afternoon_impulses = len([d for d in impulse_data if d["is_impulse"] and 12 <= d["transaction"].date.hour < 17])
-    evening_impulses = len([d for d in impulse_data if d["is_impulse"] and 17 <= d["transaction"].date.hour < 21])
-    night_impulses = len([d for d in impulse_data if d["is_impulse"] and (d["transaction"].date.hour >= 21 or d["transaction"].date.hour < 6)])
+    morning_impulses = sum(1 for d in impulse_data if d["is_impulse"] and 6 <= d["transaction"].date.hour < 12)
+    afternoon_impulses = sum(1 for d in impulse_data if d["is_impulse"] and 12 <= d["transaction"].date.hour < 17)
+    evening_impulses = sum(1 for d in impulse_data if d["is_impulse"] and 17 <= d["transaction"].date.hour < 21)
+    night_impulses = sum(1 for d in impulse_data if d["is_impulse"] and (d["transaction"].date.hour >= 21 or d["transaction"].date.hour < 6))
     
     time_data = pd.DataFrame({
         "Time": ["🌅 Morning", "☀️ Afternoon", "🌆 Evening", "🌙 Night"],
         "Impulse Purchases": [morning_impulses, afternoon_impulses, evening_impulses, night_impulses]
     })
     
-    fig_time = px.bar(
-        time_data, x="Time", y="Impulse Purchases",
-        title="⏰ Impulse Purchases by Time of Day",
-        color="Impulse Purchases",
-        color_continuous_scale=["#4ECDC4", "#FFD93D", "#FF6B6B"]
-    )
+    fig_time = go.Figure(data=go.Bar(
+        x=time_data["Time"].values, y=time_data["Impulse Purchases"].values,
+        marker=dict(
+            color=time_data["Impulse Purchases"].values,
+            colorscale=["#4ECDC4", "#FFD93D", "#FF6B6B"],
+            colorbar=dict(title="Impulse Purchases")
+        )
+    ))
     fig_time.update_layout(
+        title="⏰ Impulse Purchases by Time of Day",
+        xaxis_title="Time", yaxis_title="Impulse Purchases",
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
     )
@@ -2732,42 +2823,215 @@ if monthly_income > 0:
 
 st.markdown("## 💳 Add New Transaction")
 
-# Transaction input form with error handling
+# Columnar (SoA) transaction buffers kept in session state for the analytics reducer
+# The script (and so SpendingCategory) is re-executed every rerun while transactions persist
+# in session state, so category tables are keyed by the stable .value rather than the member
+_CAT_CODE = {c.value: i for i, c in enumerate(SpendingCategory)}
+# Category options for the add-transaction selectbox, in enum order
+_ALL_CATEGORIES = list(SpendingCategory)
+# Display labels indexed by category code
+_CAT_VALUES = np.array(list(_CAT_CODE), dtype=object)
+# Mood emoji indexed by sign(vibe_impact) + 1
+_MOOD = np.array(('😔', '😐', '😊'), dtype=object)
+
+def _init_tx_arrays():
+    """(Re)build the columnar transaction buffers, oldest first"""
+    transactions = sorted(st.session_state.transactions, key=lambda t: t.date)
+    st.session_state._dates = np.array([t.date for t in transactions], dtype='datetime64[us]')
+    st.session_state._amt = np.array([t.amount for t in transactions], dtype=np.float64)
+    st.session_state._vibe = np.array([t.vibe_impact for t in transactions], dtype=np.float32)
+    st.session_state._cat = np.array([_CAT_CODE[t.category.value] for t in transactions], dtype=np.int8)
+    st.session_state._descs = np.array([t.description for t in transactions], dtype=object)
+    st.session_state._merchants = np.array([t.merchant for t in transactions], dtype=object)
+    _init_amount_strings()
+    # Seed every category at zero so ties resolve in enum order, like max() over SpendingCategory did
+    st.session_state._cat_counts = Counter({c.value: 0 for c in SpendingCategory})
+    st.session_state._cat_counts.update(t.category.value for t in transactions)
+    # Running aggregates for the analytics metrics, updated on every insert
+    st.session_state._sum_amount, st.session_state._pos_count = _tx_stats(st.session_state._amt, st.session_state._vibe)
+    st.session_state._count = st.session_state._amt.size
+
+def _init_amount_strings():
+    """Preformat every amount in the active currency; later inserts format only their own row"""
+    st.session_state._amt_strs = np.array([format_currency(a) for a in st.session_state._amt], dtype=object)
+    st.session_state._amt_strs_currency = st.session_state.currency
+
+def _ensure_tx_arrays():
+    """Make sure the SoA buffers exist and match the transaction list"""
+    if st.session_state.get('_amt') is None or st.session_state._amt.size != len(st.session_state.transactions):
+        _init_tx_arrays()
+    elif st.session_state._amt_strs_currency != st.session_state.currency:
+        _init_amount_strings()
+
+def _append_tx_arrays(*batch):
+    """Extend the SoA buffers with newly added transactions (date-sorted, none older than the buffers)"""
+    for key, values in (
+        ('_dates', [t.date for t in batch]),
+        ('_amt', [t.amount for t in batch]),
+        ('_vibe', [t.vibe_impact for t in batch]),
+        ('_cat', [_CAT_CODE[t.category.value] for t in batch]),
+        ('_descs', [t.description for t in batch]),
+        ('_merchants', [t.merchant for t in batch]),
+        ('_amt_strs', [format_currency(t.amount) for t in batch]),
+    ):
+        arr = st.session_state[key]
+        st.session_state[key] = np.concatenate((arr, np.array(values, dtype=arr.dtype)))
+    st.session_state._cat_counts.update(t.category.value for t in batch)
+    # One concatenate per column, then the aggregates fold in the new tail in one pass
+    total, pos = _tx_stats(st.session_state._amt[-len(batch):], st.session_state._vibe[-len(batch):])
+    st.session_state._sum_amount += total
+    st.session_state._count += len(batch)
+    st.session_state._pos_count += pos
+
+def _tx_stats(amt, vibe):
+    """Total spend and positive-vibe count over the SoA buffers"""
+    total = float(amt.sum())
+    pos = int(np.count_nonzero(vibe > 0))
+    return total, pos
+
+def _make_transaction(amount, description, category, merchant="", vibe_impact=0.0, date=None):
+    """Validate raw input and build a well-formed Transaction (raises ValueError)"""
+    description = str(description).strip()
+    if not description:
+        raise ValueError("Please enter a description for your transaction!")
+    amount = float(amount)
+    if not math.isfinite(amount) or amount <= 0:
+        raise ValueError("Amount must be a positive number!")
+    vibe_impact = float(vibe_impact)
+    if not -1.0 <= vibe_impact <= 1.0:
+        raise ValueError("Vibe impact must be between -1 and 1!")
+    if getattr(category, 'value', None) not in _CAT_CODE:
+        raise ValueError(f"Unknown spending category: {category}")
+    return Transaction(
+        date=date or datetime.now(),
+        amount=amount,
+        description=description,
+        category=category,
+        merchant=str(merchant or "").strip(),
+        vibe_impact=vibe_impact
+    )
+
+def _submit_transaction():
+    """Form callback: record the submitted transaction before the rerun renders the page"""
+    try:
+        # Validate once here so the log and analytics can use plain attribute access
+        new_transaction = _make_transaction(
+            st.session_state.tx_amount, st.session_state.tx_description, st.session_state.tx_category,
+            st.session_state.tx_merchant, st.session_state.tx_vibe
+        )
+        if st.session_state.get('_amt') is not None:
+            _append_tx_arrays(new_transaction)
+        st.session_state.transactions.append(new_transaction)
+        st.session_state._tx_notice = ('success', f"✅ Added: {new_transaction.description} - {format_currency(new_transaction.amount)}")
+    except ValueError as e:
+        st.session_state._tx_notice = ('warning', str(e))
+    except Exception as e:
+        st.session_state._tx_notice = ('error', f"Error adding transaction: {str(e)}")
+        st.session_state.error_count += 1
+        st.session_state.last_error = str(e)
+
+# CSV category cells may use the enum value ("✨ Joy") or its name ("joy"), in any case
+_CATEGORY_ALIASES = {key: c for c in SpendingCategory for key in (c.value.lower(), c.name.lower())}
+
+def _import_transactions():
+    """Uploader callback: validate a CSV of transactions and add the good rows in one batch"""
+    uploader_key = f"tx_csv_{st.session_state.get('_tx_csv_gen', 0)}"
+    uploaded = st.session_state.get(uploader_key)
+    if uploaded is None:
+        st.session_state._tx_notice = ('warning', "Choose a CSV file to import first!")
+        return
+    try:
+        uploaded.seek(0)
+        df = pd.read_csv(uploaded)
+        df.columns = [str(col).strip().lower() for col in df.columns]
+        missing = {'amount', 'description', 'category'}.difference(df.columns)
+        if missing:
+            raise ValueError(f"CSV is missing required columns: {', '.join(sorted(missing))}")
+        
+        rows = len(df)
+        if 'date' in df:
+            raw_dates = df['date'].astype(str).str.strip().where(df['date'].notna(), "")
+            blank_dates = raw_dates.eq("")
+            # Each cell is parsed on its own format; offsets are normalized to UTC and dropped, since
+            # every other Transaction date is naive
+            dates = pd.to_datetime(
+                raw_dates.mask(blank_dates), errors='coerce', utc=True, format='mixed'
+            ).dt.tz_convert(None)
+        else:
+            dates = pd.Series(pd.NaT, index=df.index)
+            blank_dates = pd.Series(True, index=df.index)
+        merchants = df['merchant'].fillna("") if 'merchant' in df else [""] * rows
+        vibes = df['vibe_impact'].fillna(0.0) if 'vibe_impact' in df else [0.0] * rows
+        
+        batch, skipped = [], 0
+        for amount, description, category, merchant, vibe, date, blank_date in zip(
+            df['amount'], df['description'].fillna(""), df['category'].astype(str), merchants, vibes, dates, blank_dates
+        ):
+            # Only a truly empty date cell defaults to now; an unreadable one is an invalid row
+            if pd.isna(date) and not blank_date:
+                skipped += 1
+                continue
+            try:
+                batch.append(_make_transaction(
+                    amount, description, _CATEGORY_ALIASES.get(category.strip().lower()), merchant, vibe,
+                    None if pd.isna(date) else date.to_pydatetime()
+                ))
+            except (ValueError, TypeError):
+                skipped += 1
+        if not batch:
+            raise ValueError("No valid transactions found in the CSV!")
+        
+        batch.sort(key=lambda t: t.date)
+        # Rows newer than the buffers extend them in place; backdated rows fall back to a full rebuild
+        if st.session_state.get('_amt') is not None and (
+            st.session_state._dates.size == 0 or np.datetime64(batch[0].date, 'us') >= st.session_state._dates[-1]
+        ):
+            _append_tx_arrays(*batch)
+        st.session_state.transactions.extend(batch)
+        
+        message = f"✅ Imported {len(batch)} transactions - {format_currency(sum(t.amount for t in batch))}"
+        if skipped:
+            message += f" ({skipped} invalid rows skipped)"
+        st.session_state._tx_notice = ('success', message)
+        # A fresh uploader key clears the file, so a second click cannot import the same rows again
+        st.session_state._tx_csv_gen = st.session_state.get('_tx_csv_gen', 0) + 1
+    except ValueError as e:
+        st.session_state._tx_notice = ('warning', str(e))
+    except Exception as e:
+        st.session_state._tx_notice = ('error', f"Error importing transactions: {str(e)}")
+        st.session_state.error_count += 1
+        st.session_state.last_error = str(e)
+
+# Transaction input form with error handling; one rerun per submit, inputs reset automatically
 with st.expander("➕ Add a New Transaction", expanded=False):
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        new_amount = st.number_input("💰 Amount", min_value=0.01, value=10.0, step=0.5)
-        new_description = st.text_input("📝 Description", placeholder="What did you spend on?")
+    with st.form("add_tx", clear_on_submit=True):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.number_input("💰 Amount", min_value=0.01, value=10.0, step=0.5, key="tx_amount")
+            st.text_input("📝 Description", placeholder="What did you spend on?", key="tx_description")
+        
+        with col2:
+            st.selectbox("📂 Category", _ALL_CATEGORIES, key="tx_category")
+            st.text_input("🏪 Merchant", placeholder="Where did you spend?", key="tx_merchant")
+        
+        with col3:
+            st.slider("😊 Vibe Impact", -1.0, 1.0, 0.0, 0.1, key="tx_vibe",
+                      help="How did this purchase make you feel?")
+            
+            st.form_submit_button("✅ Add Transaction", type="primary", use_container_width=True,
+                                  on_click=_submit_transaction)
     
-    with col2:
-        new_category = st.selectbox("📂 Category", list(SpendingCategory))
-        new_merchant = st.text_input("🏪 Merchant", placeholder="Where did you spend?")
+    st.markdown("**📥 Bulk Import**")
+    st.file_uploader(
+        "Transactions CSV", type="csv", key=f"tx_csv_{st.session_state.get('_tx_csv_gen', 0)}",
+        help="Columns: amount, description, category; optional: merchant, vibe_impact, date"
+    )
+    st.button("📥 Import Transactions", use_container_width=True, on_click=_import_transactions)
     
-    with col3:
-        new_vibe_impact = st.slider("😊 Vibe Impact", -1.0, 1.0, 0.0, 0.1, 
-                                   help="How did this purchase make you feel?")
-        
-        if st.button("✅ Add Transaction", type="primary", use_container_width=True):
-            try:
-                if new_description.strip():
-                    new_transaction = Transaction(
-                        date=datetime.now(),
-                        amount=float(new_amount),
-                        description=new_description.strip(),
-                        category=new_category,
-                        merchant=new_merchant.strip(),
-                        vibe_impact=float(new_vibe_impact)
-                    )
-                    st.session_state.transactions.append(new_transaction)
-                    st.success(f"✅ Added: {new_description} - {format_currency(new_amount)}")
-                    st.rerun()
-                else:
-                    st.warning("Please enter a description for your transaction!")
-            except Exception as e:
-                st.error(f"Error adding transaction: {str(e)}")
-                st.session_state.error_count += 1
-                st.session_state.last_error = str(e)
+    tx_notice = st.session_state.pop('_tx_notice', None)
+    if tx_notice:
+        getattr(st, tx_notice[0])(tx_notice[1])
 
 # =============================================================================
 # TRANSACTION LOG & DISPLAY
@@ -2775,6 +3039,19 @@ with st.expander("➕ Add a New Transaction", expanded=False):
 
 st.markdown("## 🧾 Recent Spending Tea ☕")
 
+def _build_transaction_dataframe():
+    """Columnar log build from this session's SoA buffers"""
+    # The buffers are kept in date order, so reversed views give the newest-first log
+    return pd.DataFrame({
+        'Date': pd.DatetimeIndex(st.session_state._dates[::-1]).strftime('%m/%d'),
+        # int8 category codes feed Categorical directly, so cells are codes rather than string pointers
+        'Vibe': pd.Categorical.from_codes(st.session_state._cat[::-1], _CAT_VALUES),
+        'Amount': st.session_state._amt_strs[::-1],
+        'Description': st.session_state._descs[::-1],
+        'Merchant': st.session_state._merchants[::-1],
+        'Mood Impact': pd.Categorical.from_codes(np.sign(st.session_state._vibe[::-1]).astype(np.int8) + 1, _MOOD)
+    })
+
 # Safe transaction display with error handling
 def create_transaction_dataframe():
     try:
@@ -2782,39 +3059,42 @@ def create_transaction_dataframe():
         if not transactions:
             return pd.DataFrame({'Message': ['No transactions yet! Add your first transaction above. 💸']})
         
-        transaction_data = []
-        for t in sorted(transactions, key=lambda x: getattr(x, 'date', datetime.now()), reverse=True):
-            try:
-                transaction_data.append({
-                    'Date': getattr(t, 'date', datetime.now()).strftime('%m/%d'),
-                    'Vibe': getattr(t, 'category', SpendingCategory.ESSENTIAL).value,
-                    'Amount': format_currency(getattr(t, 'amount', 0)),
-                    'Description': getattr(t, 'description', 'Unknown'),
-                    'Merchant': getattr(t, 'merchant', 'Unknown'),
-                    'Mood Impact': '😊' if getattr(t, 'vibe_impact', 0) > 0 else '😐' if getattr(t, 'vibe_impact', 0) == 0 else '😔'
-                })
-            except Exception as e:
-                logger.warning(f"Error processing transaction: {str(e)}")
-                continue
+        _ensure_tx_arrays()
         
-        return pd.DataFrame(transaction_data)
+        # Unrelated widget reruns (sliders, inputs) reuse this session's frame; the buffers are
+        # per-session, so the frame lives in session_state rather than the process-wide st.cache_data
+        sig = (len(transactions), transactions[-1].date, st.session_state.currency)
+        if st.session_state.get('_tx_df_sig') != sig:
+            st.session_state._tx_df = _build_transaction_dataframe()
+            st.session_state._tx_df_sig = sig
+        return st.session_state._tx_df
     except Exception as e:
         logger.error(f"Error creating transaction dataframe: {str(e)}")
         st.session_state.error_count += 1
         st.session_state.last_error = str(e)
         return pd.DataFrame({'Error': ['Unable to load transactions. Please try refreshing.']})
 
+# Only the newest rows are serialized on every rerun; older rows are sent only while the toggle is on
+_LOG_PREVIEW_ROWS = 50
+
 df_transactions = create_transaction_dataframe()
-st.dataframe(df_transactions, use_container_width=True)
+st.dataframe(df_transactions.head(_LOG_PREVIEW_ROWS), use_container_width=True)
+if len(df_transactions) > _LOG_PREVIEW_ROWS and st.toggle(
+    f"📜 Show full history ({len(df_transactions)} transactions)", key="log_show_all"
+):
+    st.dataframe(df_transactions.iloc[_LOG_PREVIEW_ROWS:], use_container_width=True)
 
 # Transaction analytics
 if len(st.session_state.transactions) > 0:
+    # Metrics read the running aggregates, so this is O(1) per rerun
+    safe_execute(_ensure_tx_arrays, error_message="Unable to load transaction analytics")
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         try:
             avg_transaction = handle_calculation_error(
-                lambda: sum(t.amount for t in st.session_state.transactions) / len(st.session_state.transactions),
+                lambda: st.session_state._sum_amount / st.session_state._count,
                 0
             )
             st.metric("💰 Avg Transaction", format_currency(avg_transaction))
@@ -2823,15 +3103,15 @@ if len(st.session_state.transactions) > 0:
     
     with col2:
         try:
-            positive_vibes = len([t for t in st.session_state.transactions if getattr(t, 'vibe_impact', 0) > 0])
+            positive_vibes = st.session_state._pos_count
             st.metric("😊 Positive Purchases", f"{positive_vibes}")
         except:
             st.metric("😊 Positive Purchases", "N/A")
     
     with col3:
         try:
-            most_category = max(SpendingCategory, key=lambda cat: len([t for t in st.session_state.transactions if getattr(t, 'category', None) == cat]))
-            st.metric("🔥 Top Category", most_category.value)
+            most_category = st.session_state._cat_counts.most_common(1)[0][0]
+            st.metric("🔥 Top Category", most_category)
         except:
             st.metric("🔥 Top Category", "N/A")
 
@@ -2848,6 +3128,21 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Goal selectbox options; literal tuples are constants, not rebuilt lists
+_PRIORITIES = (
+    "🛡️ Build Emergency Fund",
+    "💳 Pay Off Debt",
+    "📈 Start Investing",
+    "🏠 Save for Big Purchase",
+    "👑 Maximize Wealth Building"
+)
+_LIFESTYLES = (
+    "😩 Survival Mode (Minimize expenses)",
+    "😌 Comfort Mode (Balanced approach)",
+    "👑 Slay Mode (Aggressive wealth building)"
+)
+_RISK = ("Conservative (Safety first)", "Moderate (Balanced)", "Aggressive (High growth)")
+
 # Main salary input section
 col1, col2, col3 = st.columns(3)
 
@@ -2902,65 +3197,262 @@ with col3:
     st.markdown("### 🚀 Your Financial Goals")
     financial_priority = st.selectbox(
         "Primary Financial Priority",
-        [
-            "🛡️ Build Emergency Fund",
-            "💳 Pay Off Debt",
-            "📈 Start Investing",
-            "🏠 Save for Big Purchase",
-            "👑 Maximize Wealth Building"
-        ]
+        _PRIORITIES
     )
     
     lifestyle_mode = st.selectbox(
         "Current Lifestyle Mode",
-        [
-            "😩 Survival Mode (Minimize expenses)",
-            "😌 Comfort Mode (Balanced approach)", 
-            "👑 Slay Mode (Aggressive wealth building)"
-        ]
+        _LIFESTYLES
     )
     
     investment_risk = st.selectbox(
         "Investment Risk Tolerance",
-        ["Conservative (Safety first)", "Moderate (Balanced)", "Aggressive (High growth)"]
+        _RISK
     )
 
 # =============================================================================
 # ADVANCED FINANCIAL BREAKDOWN CALCULATOR
 # =============================================================================
 
+@st.cache_data
+def _payoff_schedule(debt, payment, apr):
+    """Months to clear `debt` at `payment`/month and `apr`% APR, plus the total interest paid"""
+    if payment > 0 and apr > 0:
+        monthly_rate = (apr / 100) / 12
+        if monthly_rate * debt < payment:
+            # log1p keeps both logs accurate for the small monthly rates involved
+            months = -(1/12) * (math.log1p(-(monthly_rate * debt / payment)) / math.log1p(monthly_rate))
+            return months, (payment * months) - debt
+        return float('inf'), float('inf')
+    return (debt / payment if payment > 0 else float('inf')), 0
+
+def _milestone_net_worths(current_savings, monthly_savings, monthly_investment, annual_return, years):
+    """Projected net worth after each entry of `years`, evaluated for all milestones at once"""
+    years = np.asarray(years, dtype=np.float64)
+    projected = current_savings + monthly_savings * 12 * years
+    if monthly_investment > 0:
+        # Assuming some investment growth
+        projected += monthly_investment * 12 * years * (1 + annual_return) ** years
+    return projected
+
+@st.cache_data
+def _immediate_actions_markdown(low_savings, paying_extra_on_debt, can_invest):
+    """This week's action bullets for the given plan flags, capped at five"""
+    immediate_actions = []
+    
+    if low_savings:
+        immediate_actions.append("🏦 Open high-yield savings account (Marcus, Ally, Capital One)")
+        immediate_actions.append("💰 Set up automatic transfer of $50-100/week to savings")
+    
+    if paying_extra_on_debt:
+        immediate_actions.append("📞 Call credit card companies to negotiate lower rates")
+        immediate_actions.append("💳 Set up automatic extra payments to highest interest debt")
+    
+    if can_invest:
+        immediate_actions.append("📊 Open investment account (Fidelity, Vanguard, or Schwab)")
+        immediate_actions.append("🤖 Set up automatic investing in index funds")
+    
+    immediate_actions.append("📱 Download budgeting app (Mint, YNAB, or PocketGuard)")
+    immediate_actions.append("🔍 Review and cancel unused subscriptions")
+    
+    return "\n".join(f"- {action}" for action in immediate_actions[:5])
+
+@st.cache_data
+def _monthly_goals_markdown(emergency_need, wants, savings, debt_payment):
+    """30-day goal bullets from preformatted amounts; None skips the emergency fund or debt goal"""
+    monthly_goals = []
+    
+    if emergency_need is not None:
+        monthly_goals.append(f"🛡️ Save {emergency_need} for emergency fund")
+    
+    monthly_goals.append(f"📊 Track all expenses and stay within {wants} fun budget")
+    monthly_goals.append(f"💰 Automate {savings} monthly savings")
+    
+    if debt_payment is not None:
+        monthly_goals.append(f"💳 Pay {debt_payment} toward debt elimination")
+    
+    monthly_goals.append("📚 Read one personal finance book or take online course")
+    monthly_goals.append("🎯 Set up goal tracking for your biggest financial priority")
+    
+    return "\n".join(f"- {goal}" for goal in monthly_goals)
+
+# Pre-defined common goals as (label, target amount); the custom goal's amount comes from an input
+_COMMON_GOALS = (
+    ("🏖️ Dream Vacation", 3000),
+    ("🚗 Car Down Payment", 5000),
+    ("🏠 House Down Payment", 40000),
+    ("💻 New Laptop/Setup", 2000),
+    ("📚 Education/Certification", 5000),
+    ("💍 Wedding Fund", 20000),
+    ("🎂 Custom Goal", 0),
+)
+# Goal timelines and their lengths in months, matched by position
+_TIMELINE_LABELS = ("3 months", "6 months", "1 year", "2 years", "3 years", "5 years")
+_TIMELINE_MONTHS = (3, 6, 12, 24, 36, 60)
+
+# Stock/bond percentages by [risk_idx, age - _MIN_INVESTOR_AGE], precomputed for every slider age
+_MIN_INVESTOR_AGE, _MAX_INVESTOR_AGE = 18, 35
+_ages = np.arange(_MIN_INVESTOR_AGE, _MAX_INVESTOR_AGE + 1)
+_STOCK_PCT = np.vstack((
+    np.maximum(20, 60 - _ages),  # Conservative
+    np.maximum(40, 70 - (_ages - 20)),  # Moderate
+    np.minimum(95, 80 + (35 - _ages)),  # Aggressive
+))
+_BOND_PCT = np.vstack((
+    np.minimum(50, 40 + (_ages - 20)),
+    np.minimum(40, 30 + (_ages - 20)),
+    np.maximum(5, 20 - (35 - _ages)),
+))
+
+# Budget split per lifestyle mode, indexed like _LIFESTYLES: (needs %, wants %, savings %, emoji, description)
+_MODE_TABLE = (
+    (70, 15, 15, "🛡️", "Focus on stability and emergency fund"),  # Survival
+    (50, 30, 20, "😌", "Balanced living with room for fun"),  # Comfort
+    (45, 25, 30, "👑", "Aggressive wealth building for financial freedom"),  # Slay
+)
+
+# Blueprint card templates, built once and filled with str.format
+_NEEDS_CARD_TMPL = """
+<div class="survival-card">
+    <h3>🏠 NEEDS ({pct}%)</h3>
+    <h2>{amt}</h2>
+    <div style="font-size: 0.9em; margin-top: 10px;">
+        <strong>Includes:</strong><br>
+        • Rent/Mortgage<br>
+        • Groceries & Utilities<br>
+        • Transportation<br>
+        • Insurance & Phone<br>
+        • Minimum Debt Payments
+    </div>
+</div>
+"""
+_WANTS_CARD_TMPL = """
+<div class="comfort-card">
+    <h3>✨ WANTS ({pct}%)</h3>
+    <h2>{amt}</h2>
+    <div style="font-size: 0.9em; margin-top: 10px;">
+        <strong>Includes:</strong><br>
+        • Dining Out & Entertainment<br>
+        • Shopping & Hobbies<br>
+        • Subscriptions<br>
+        • Travel & Fun<br>
+        • Personal Care
+    </div>
+</div>
+"""
+_SAVINGS_CARD_TMPL = """
+<div class="slay-card">
+    <h3>💰 SAVINGS ({pct}%)</h3>
+    <h2>{amt}</h2>
+    <div style="font-size: 0.9em; margin-top: 10px;">
+        <strong>Breakdown:</strong><br>
+        • Emergency Fund<br>
+        • Investment Accounts<br>
+        • Goal Savings<br>
+        • Extra Debt Payment<br>
+        • Future Planning
+    </div>
+</div>
+"""
+_DEBT_FOCUS_CARD_TMPL = """
+<div class="investment-card">
+    <h3>💳 DEBT PAYOFF</h3>
+    <h2>{amt}</h2>
+    <div style="font-size: 0.9em; margin-top: 10px;">
+        <strong>Strategy:</strong><br>
+        • Minimum: {minimum}<br>
+        • Extra: {extra}<br>
+        • Total Focus<br>
+        • Avalanche Method
+    </div>
+</div>
+"""
+_BONUS_CARD_TMPL = """
+<div class="investment-card">
+    <h3>🚀 BONUS POWER</h3>
+    <h2>{amt}</h2>
+    <div style="font-size: 0.9em; margin-top: 10px;">
+        <strong>Opportunity:</strong><br>
+        • Full Savings Potential<br>
+        • Investment Ready<br>
+        • Wealth Building<br>
+        • Financial Freedom
+    </div>
+</div>
+"""
+_GOAL_TRACKER_TMPL = """
+<div class="goal-tracker">
+    <h4>{title}</h4>
+    <h2>{value}</h2>
+    <p>{note}</p>
+</div>
+"""
+_INVESTMENT_CARD_TMPL = """
+<div class="investment-card">
+    <h4>{title}</h4>
+    <h2>{value}</h2>
+    <p>{note}</p>
+</div>
+"""
+_PROJECTION_CARD_TMPL = """
+<div class="slay-card">
+    <h4>💰 {years} Year Projection</h4>
+    <h2>{future_value}</h2>
+    <div style="font-size: 0.8em; margin-top: 10px;">
+        <p>Contributions: {contributions}</p>
+        <p>Growth: {growth}</p>
+        <p>Monthly: {monthly}</p>
+    </div>
+</div>
+"""
+_MILESTONE_CARD_TMPL = """
+<div class="milestone-badge" style="display: block; margin: 10px 0; padding: 15px;">
+    <h4>Age {age} Goal</h4>
+    <h3>{target}</h3>
+    <p>{multiplier}x Annual Income</p>
+    <small>{status}</small>
+</div>
+"""
+
+def _card_row(cards, columns):
+    """Emit a row of HTML cards as one grid, i.e. one st.markdown call instead of one per column"""
+    st.markdown(
+        f"<div style='display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 0 16px;'>"
+        + "".join(card.strip() for card in cards)
+        + "</div>",
+        unsafe_allow_html=True
+    )
+
+def _card_stack(cards):
+    """Emit vertically stacked HTML cards in one st.markdown call, keeping the usual element gap"""
+    st.markdown(
+        "<div style='display: flex; flex-direction: column; gap: 1rem;'>"
+        + "".join(card.strip() for card in cards)
+        + "</div>",
+        unsafe_allow_html=True
+    )
+
 if total_monthly_income > 0:
     st.markdown("## 📊 Your Personalized Financial Blueprint")
     
+    # Integer branch keys from the selectbox positions, resolved once instead of per substring test
+    mode_idx = _LIFESTYLES.index(lifestyle_mode)  # 0 Survival, 1 Comfort, 2 Slay
+    risk_idx = _RISK.index(investment_risk)  # 0 Conservative, 1 Moderate, 2 Aggressive
+    
     # Determine budget allocation based on lifestyle mode
-    if "Survival" in lifestyle_mode:
-        needs_percent = 70
-        wants_percent = 15
-        savings_percent = 15
-        mode_emoji = "🛡️"
-        mode_description = "Focus on stability and emergency fund"
-    elif "Comfort" in lifestyle_mode:
-        needs_percent = 50
-        wants_percent = 30
-        savings_percent = 20
-        mode_emoji = "😌"
-        mode_description = "Balanced living with room for fun"
-    else:  # Slay mode
-        needs_percent = 45
-        wants_percent = 25
-        savings_percent = 30
-        mode_emoji = "👑"
-        mode_description = "Aggressive wealth building for financial freedom"
-    
-    # Calculate allocations
-    needs_amount = total_monthly_income * (needs_percent / 100)
-    wants_amount = total_monthly_income * (wants_percent / 100)
-    savings_amount = total_monthly_income * (savings_percent / 100)
+    needs_percent, wants_percent, savings_percent, mode_emoji, mode_description = _MODE_TABLE[mode_idx]
+    
+    # Calculate allocations as one vector of rates; the needs share is reused for the emergency target
+    budget_amounts = total_monthly_income * np.array((needs_percent, wants_percent, savings_percent), dtype=np.float64) * 0.01
+    needs_amount, wants_amount, savings_amount = budget_amounts
     
     # Adjust for existing debt payments
     adjusted_savings = max(0, savings_amount - monthly_debt_payment)
     debt_payoff_extra = savings_amount - adjusted_savings
     
+    # Amounts that appear on several cards are formatted once per rerun
+    adjusted_savings_str = format_currency(adjusted_savings, 0)
+    
     # Display budget breakdown
     st.markdown(f"""
     <div class="main-header">
@@ -2970,86 +3462,23 @@ if total_monthly_income > 0:
     </div>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="survival-card">
-            <h3>🏠 NEEDS ({needs_percent}%)</h3>
-            <h2>{format_currency(needs_amount, 0)}</h2>
-            <div style="font-size: 0.9em; margin-top: 10px;">
-                <strong>Includes:</strong><br>
-                • Rent/Mortgage<br>
-                • Groceries & Utilities<br>
-                • Transportation<br>
-                • Insurance & Phone<br>
-                • Minimum Debt Payments
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="comfort-card">
-            <h3>✨ WANTS ({wants_percent}%)</h3>
-            <h2>{format_currency(wants_amount, 0)}</h2>
-            <div style="font-size: 0.9em; margin-top: 10px;">
-                <strong>Includes:</strong><br>
-                • Dining Out & Entertainment<br>
-                • Shopping & Hobbies<br>
-                • Subscriptions<br>
-                • Travel & Fun<br>
-                • Personal Care
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    budget_cards = [
+        _NEEDS_CARD_TMPL.format(pct=needs_percent, amt=format_currency(needs_amount, 0)),
+        _WANTS_CARD_TMPL.format(pct=wants_percent, amt=format_currency(wants_amount, 0)),
+        _SAVINGS_CARD_TMPL.format(pct=savings_percent, amt=adjusted_savings_str),
+    ]
     
-    with col3:
-        st.markdown(f"""
-        <div class="slay-card">
-            <h3>💰 SAVINGS ({savings_percent}%)</h3>
-            <h2>{format_currency(adjusted_savings, 0)}</h2>
-            <div style="font-size: 0.9em; margin-top: 10px;">
-                <strong>Breakdown:</strong><br>
-                • Emergency Fund<br>
-                • Investment Accounts<br>
-                • Goal Savings<br>
-                • Extra Debt Payment<br>
-                • Future Planning
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    if monthly_debt_payment > 0:
+        total_debt_focus = monthly_debt_payment + debt_payoff_extra
+        budget_cards.append(_DEBT_FOCUS_CARD_TMPL.format(
+            amt=format_currency(total_debt_focus, 0),
+            minimum=format_currency(monthly_debt_payment, 0),
+            extra=format_currency(debt_payoff_extra, 0)
+        ))
+    else:
+        budget_cards.append(_BONUS_CARD_TMPL.format(amt=adjusted_savings_str))
     
-    with col4:
-        if monthly_debt_payment > 0:
-            total_debt_focus = monthly_debt_payment + debt_payoff_extra
-            st.markdown(f"""
-            <div class="investment-card">
-                <h3>💳 DEBT PAYOFF</h3>
-                <h2>{format_currency(total_debt_focus, 0)}</h2>
-                <div style="font-size: 0.9em; margin-top: 10px;">
-                    <strong>Strategy:</strong><br>
-                    • Minimum: {format_currency(monthly_debt_payment, 0)}<br>
-                    • Extra: {format_currency(debt_payoff_extra, 0)}<br>
-                    • Total Focus<br>
-                    • Avalanche Method
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="investment-card">
-                <h3>🚀 BONUS POWER</h3>
-                <h2>{format_currency(adjusted_savings, 0)}</h2>
-                <div style="font-size: 0.9em; margin-top: 10px;">
-                    <strong>Opportunity:</strong><br>
-                    • Full Savings Potential<br>
-                    • Investment Ready<br>
-                    • Wealth Building<br>
-                    • Financial Freedom
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    _card_row(budget_cards, 4)
 
     # =============================================================================
     # EMERGENCY FUND CALCULATOR
@@ -3058,38 +3487,18 @@ if total_monthly_income > 0:
     st.markdown("### 🛡️ Emergency Fund Strategy")
     
     emergency_months = st.slider("Target Emergency Fund (Months of Expenses)", 3, 12, 6)
-    emergency_target = needs_amount * emergency_months
+    emergency_target = budget_amounts[0] * emergency_months
     emergency_progress = (current_savings_amount / emergency_target * 100) if emergency_target > 0 else 0
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="goal-tracker">
-            <h4>🎯 Emergency Fund Goal</h4>
-            <h2>{format_currency(emergency_target, 0)}</h2>
-            <p>{emergency_months} months of expenses</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="goal-tracker">
-            <h4>💰 Current Progress</h4>
-            <h2>{format_currency(current_savings_amount, 0)}</h2>
-            <p>{emergency_progress:.1f}% Complete</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        months_to_goal = max(0, (emergency_target - current_savings_amount) / (adjusted_savings * 0.5)) if adjusted_savings > 0 else 0
-        st.markdown(f"""
-        <div class="goal-tracker">
-            <h4>⏰ Time to Goal</h4>
-            <h2>{months_to_goal:.1f} months</h2>
-            <p>At 50% savings allocation</p>
-        </div>
-        """, unsafe_allow_html=True)
+    months_to_goal = max(0, (emergency_target - current_savings_amount) / (adjusted_savings * 0.5)) if adjusted_savings > 0 else 0
+    _card_row([
+        _GOAL_TRACKER_TMPL.format(title="🎯 Emergency Fund Goal", value=format_currency(emergency_target, 0),
+                                  note=f"{emergency_months} months of expenses"),
+        _GOAL_TRACKER_TMPL.format(title="💰 Current Progress", value=format_currency(current_savings_amount, 0),
+                                  note=f"{emergency_progress:.1f}% Complete"),
+        _GOAL_TRACKER_TMPL.format(title="⏰ Time to Goal", value=f"{months_to_goal:.1f} months",
+                                  note="At 50% savings allocation"),
+    ], 3)
     
     # Progress bar
     st.markdown(f"""
@@ -3109,74 +3518,39 @@ if total_monthly_income > 0:
     # Calculate investment amount (portion of savings after emergency fund priority)
     emergency_monthly_need = max(0, (emergency_target - current_savings_amount) / 12)
     available_for_investment = max(0, adjusted_savings - emergency_monthly_need)
+    available_for_investment_str = format_currency(available_for_investment, 0)
     
-    if available_for_investment > 0:
+    @st.fragment
+    def _investment_allocation_section(available_for_investment, available_for_investment_str, risk_idx):
+        """Age-based allocation cards; moving the age slider reruns only this fragment"""
         # Age-based investment allocation
-        user_age = st.slider("Your Age", 18, 35, 25)
+        user_age = st.slider("Your Age", _MIN_INVESTOR_AGE, _MAX_INVESTOR_AGE, 25)
         
         # Determine allocation based on age and risk tolerance
-        if "Conservative" in investment_risk:
-            stock_percent = max(20, 60 - user_age)
-            bond_percent = min(50, 40 + (user_age - 20))
-        elif "Aggressive" in investment_risk:
-            stock_percent = min(95, 80 + (35 - user_age))
-            bond_percent = max(5, 20 - (35 - user_age))
-        else:  # Moderate
-            stock_percent = max(40, 70 - (user_age - 20))
-            bond_percent = min(40, 30 + (user_age - 20))
-        
+        stock_percent = int(_STOCK_PCT[risk_idx, user_age - _MIN_INVESTOR_AGE])
+        bond_percent = int(_BOND_PCT[risk_idx, user_age - _MIN_INVESTOR_AGE])
         cash_percent = 100 - stock_percent - bond_percent
         
         # Calculate dollar amounts
-        stock_amount = available_for_investment * (stock_percent / 100)
-        bond_amount = available_for_investment * (bond_percent / 100)
-        cash_amount = available_for_investment * (cash_percent / 100)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="investment-card">
-                <h4>📊 Total Monthly Investment</h4>
-                <h2>{format_currency(available_for_investment, 0)}</h2>
-                <p>Available after emergency fund</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="investment-card">
-                <h4>📈 Stocks/ETFs ({stock_percent}%)</h4>
-                <h2>{format_currency(stock_amount, 0)}</h2>
-                <p>VTI, VXUS, Growth funds</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="investment-card">
-                <h4>🏛️ Bonds ({bond_percent}%)</h4>
-                <h2>{format_currency(bond_amount, 0)}</h2>
-                <p>BND, Treasury bonds</p>
-            </div>
-            """, unsafe_allow_html=True)
+        stock_amount, bond_amount, cash_amount = (
+            available_for_investment * np.array((stock_percent, bond_percent, cash_percent), dtype=np.float64) * 0.01
+        )
         
-        with col4:
-            st.markdown(f"""
-            <div class="investment-card">
-                <h4>💵 Cash/HYSA ({cash_percent}%)</h4>
-                <h2>{format_currency(cash_amount, 0)}</h2>
-                <p>High-yield savings, CDs</p>
-            </div>
-            """, unsafe_allow_html=True)
+        _card_row([
+            _INVESTMENT_CARD_TMPL.format(title="📊 Total Monthly Investment", value=available_for_investment_str,
+                                         note="Available after emergency fund"),
+            _INVESTMENT_CARD_TMPL.format(title=f"📈 Stocks/ETFs ({stock_percent}%)", value=format_currency(stock_amount, 0),
+                                         note="VTI, VXUS, Growth funds"),
+            _INVESTMENT_CARD_TMPL.format(title=f"🏛️ Bonds ({bond_percent}%)", value=format_currency(bond_amount, 0),
+                                         note="BND, Treasury bonds"),
+            _INVESTMENT_CARD_TMPL.format(title=f"💵 Cash/HYSA ({cash_percent}%)", value=format_currency(cash_amount, 0),
+                                         note="High-yield savings, CDs"),
+        ], 4)
         
         # Specific investment recommendations
         st.markdown("#### 🎯 Specific Investment Recommendations")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
+        _card_row(["""
             <div class="financial-tip">
                 <h4>🚀 Gen Z Investment Essentials</h4>
                 <strong>Core Holdings:</strong><br>
@@ -3190,10 +3564,7 @@ if total_monthly_income > 0:
                 • REITs (Real Estate)<br>
                 • Small allocation to crypto (5% max)
             </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
+            """, f"""
             <div class="financial-tip">
                 <h4>💡 Investment Platform Suggestions</h4>
                 <strong>Best for Beginners:</strong><br>
@@ -3204,10 +3575,12 @@ if total_monthly_income > 0:
                 • Betterment (Auto-rebalancing)<br>
                 • Wealthfront (Tax-loss harvesting)<br>
                 • M1 Finance (Pie investing)<br><br>
-                <strong>Monthly Investment:</strong> {format_currency(available_for_investment, 0)}
+                <strong>Monthly Investment:</strong> {available_for_investment_str}
             </div>
-            """, unsafe_allow_html=True)
+            """], 2)
     
+    if available_for_investment > 0:
+        _investment_allocation_section(available_for_investment, available_for_investment_str, risk_idx)
     else:
         st.markdown("""
         <div class="warning-card">
@@ -3220,174 +3593,145 @@ if total_monthly_income > 0:
     # DEBT PAYOFF STRATEGY
     # =============================================================================
     
-    if current_debt > 0:
-        st.markdown("### 💳 Debt Elimination Strategy")
-        
+    @st.fragment
+    def _debt_strategy_section(current_debt, total_debt_payment, total_debt_payment_str):
+        """Payoff timeline and freedom date; moving the APR slider reruns only this fragment"""
         # Debt payoff calculators
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### 🔥 Avalanche Method (Recommended)")
             # Assuming average 18% APR for credit cards
-            avg_apr = st.slider("Average Debt Interest Rate (%)", 3.0, 29.9, 18.0)
-            
-            total_debt_payment = monthly_debt_payment + debt_payoff_extra
+            avg_apr = st.slider("Average Debt Interest Rate (%)", 3.0, 29.9, 18.0, key="apr")
             
             # Calculate payoff time
-            if total_debt_payment > 0 and avg_apr > 0:
-                monthly_rate = (avg_apr / 100) / 12
-                if monthly_rate * current_debt < total_debt_payment:
-                    months_to_payoff = -(1/12) * (math.log(1 - (monthly_rate * current_debt / total_debt_payment)) / math.log(1 + monthly_rate))
-                    total_interest = (total_debt_payment * months_to_payoff) - current_debt
-                else:
-                    months_to_payoff = float('inf')
-                    total_interest = float('inf')
-            else:
-                months_to_payoff = current_debt / total_debt_payment if total_debt_payment > 0 else float('inf')
-                total_interest = 0
+            months_to_payoff, total_interest = _payoff_schedule(current_debt, total_debt_payment, avg_apr)
             
             if months_to_payoff != float('inf'):
-                st.markdown(f"""
-                <div class="goal-tracker">
-                    <h4>⏰ Payoff Timeline</h4>
-                    <h2>{months_to_payoff:.1f} months</h2>
-                    <p>Total Payment: {format_currency(total_debt_payment, 0)}/month</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.markdown(f"""
+                _card_row([_GOAL_TRACKER_TMPL.format(
+                    title="⏰ Payoff Timeline", value=f"{months_to_payoff:.1f} months",
+                    note=f"Total Payment: {total_debt_payment_str}/month"
+                ), f"""
                 <div class="survival-card">
                     <h4>💰 Total Interest Saved</h4>
-                    <p>By paying {format_currency(total_debt_payment, 0)}/month instead of minimums:</p>
+                    <p>By paying {total_debt_payment_str}/month instead of minimums:</p>
                     <h3>Interest: {format_currency(total_interest, 0)}</h3>
                     <p>vs paying minimums for years!</p>
                 </div>
-                """, unsafe_allow_html=True)
+                """], 1)
         
         with col2:
             st.markdown("#### 🎯 Debt Freedom Goals")
             
-            debt_free_date = datetime.now() + timedelta(days=months_to_payoff * 30) if months_to_payoff != float('inf') else None
+            debt_free_date = _NOW + timedelta(days=int(months_to_payoff * 30)) if months_to_payoff != float('inf') else None
             
+            freedom_cards = []
             if debt_free_date:
-                st.markdown(f"""
+                freedom_cards.append(f"""
                 <div class="slay-card">
                     <h4>🎉 Debt Freedom Date</h4>
                     <h2>{debt_free_date.strftime('%B %Y')}</h2>
                     <p>Your financial independence day!</p>
                 </div>
-                """, unsafe_allow_html=True)
+                """)
             
             # Monthly savings after debt payoff
             future_monthly_boost = total_debt_payment
             annual_boost = future_monthly_boost * 12
             
-            st.markdown(f"""
+            freedom_cards.append(f"""
             <div class="investment-card">
                 <h4>🚀 Post-Debt Monthly Boost</h4>
                 <h2>{format_currency(future_monthly_boost, 0)}</h2>
                 <p>Extra for investments/goals</p>
                 <small>Annual boost: {format_currency(annual_boost, 0)}</small>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+            _card_row(freedom_cards, 1)
+    
+    # One placeholder slot, so clearing the debt tears the whole section down with its slider state
+    debt_placeholder = st.empty()
+    if current_debt > 0:
+        with debt_placeholder.container():
+            st.markdown("### 💳 Debt Elimination Strategy")
+            
+            total_debt_payment = monthly_debt_payment + debt_payoff_extra
+            total_debt_payment_str = format_currency(total_debt_payment, 0)
+            _debt_strategy_section(current_debt, total_debt_payment, total_debt_payment_str)
+    else:
+        debt_placeholder.empty()
+        st.session_state.pop("apr", None)
 
     # =============================================================================
     # GOAL-BASED SAVINGS CALCULATOR
     # =============================================================================
     
-    st.markdown("### 🎯 Goal-Based Savings Planner")
-    
-    # Pre-defined common goals
-    common_goals = {
-        "🏖️ Dream Vacation": 3000,
-        "🚗 Car Down Payment": 5000,  
-        "🏠 House Down Payment": 40000,
-        "💻 New Laptop/Setup": 2000,
-        "📚 Education/Certification": 5000,
-        "💍 Wedding Fund": 20000,
-        "🎂 Custom Goal": 0
-    }
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        selected_goal = st.selectbox("Choose Your Goal", list(common_goals.keys()))
-        if selected_goal == "🎂 Custom Goal":
-            goal_amount = st.number_input("Custom Goal Amount", min_value=100.0, value=5000.0, step=100.0)
-            goal_name = st.text_input("Goal Name", value="My Custom Goal")
-        else:
-            goal_amount = common_goals[selected_goal]
-            goal_name = selected_goal
-    
-    with col2:
-        goal_timeline = st.selectbox(
-            "Target Timeline",
-            ["3 months", "6 months", "1 year", "2 years", "3 years", "5 years"]
-        )
-        timeline_months = {"3 months": 3, "6 months": 6, "1 year": 12, "2 years": 24, "3 years": 36, "5 years": 60}
-        months = timeline_months[goal_timeline]
-    
-    with col3:
-        goal_priority = st.selectbox(
-            "Priority Level",
-            ["🔥 High Priority", "⚡ Medium Priority", "💫 Low Priority"]
-        )
-    
-    # Calculate required monthly savings
-    if goal_amount > 0 and months > 0:
-        required_monthly = goal_amount / months
-        available_for_goal = adjusted_savings * 0.3  # 30% of savings can go to goals
+    @st.fragment
+    def _goal_planner_section(adjusted_savings, adjusted_savings_str):
+        """Goal pickers and feasibility cards; changing a goal reruns only this fragment"""
+        st.markdown("### 🎯 Goal-Based Savings Planner")
         
         col1, col2, col3 = st.columns(3)
         
+        # The pickers return option positions, which index straight into the constant tables
         with col1:
-            st.markdown(f"""
-            <div class="goal-tracker">
-                <h4>🎯 {goal_name}</h4>
-                <h2>{format_currency(goal_amount, 0)}</h2>
-                <p>Target in {goal_timeline}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            goal_idx = st.selectbox("Choose Your Goal", range(len(_COMMON_GOALS)), format_func=lambda i: _COMMON_GOALS[i][0])
+            selected_goal, goal_amount = _COMMON_GOALS[goal_idx]
+            if selected_goal == "🎂 Custom Goal":
+                goal_amount = st.number_input("Custom Goal Amount", min_value=100.0, value=5000.0, step=100.0)
+                goal_name = st.text_input("Goal Name", value="My Custom Goal")
+            else:
+                goal_name = selected_goal
         
         with col2:
-            st.markdown(f"""
-            <div class="goal-tracker">
-                <h4>💰 Required Monthly</h4>
-                <h2>{format_currency(required_monthly, 0)}</h2>
-                <p>To reach your goal</p>
-            </div>
-            """, unsafe_allow_html=True)
+            timeline_idx = st.selectbox("Target Timeline", range(len(_TIMELINE_LABELS)), format_func=_TIMELINE_LABELS.__getitem__)
+            goal_timeline = _TIMELINE_LABELS[timeline_idx]
+            months = _TIMELINE_MONTHS[timeline_idx]
         
         with col3:
+            goal_priority = st.selectbox(
+                "Priority Level",
+                ["🔥 High Priority", "⚡ Medium Priority", "💫 Low Priority"]
+            )
+        
+        # Calculate required monthly savings
+        if goal_amount > 0 and months > 0:
+            required_monthly = goal_amount / months
+            required_monthly_str = format_currency(required_monthly, 0)
+            available_for_goal = adjusted_savings * 0.3  # 30% of savings can go to goals
+        
             feasibility = "✅ Totally Doable!" if required_monthly <= available_for_goal else "⚠️ Needs Adjustment"
-            st.markdown(f"""
-            <div class="goal-tracker">
-                <h4>📊 Feasibility</h4>
-                <h2>{feasibility}</h2>
-                <p>Available: {format_currency(available_for_goal, 0)}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            _card_row([
+                _GOAL_TRACKER_TMPL.format(title=f"🎯 {goal_name}", value=format_currency(goal_amount, 0),
+                                          note=f"Target in {goal_timeline}"),
+                _GOAL_TRACKER_TMPL.format(title="💰 Required Monthly", value=required_monthly_str,
+                                          note="To reach your goal"),
+                _GOAL_TRACKER_TMPL.format(title="📊 Feasibility", value=feasibility,
+                                          note=f"Available: {format_currency(available_for_goal, 0)}"),
+            ], 3)
+        
+            # Goal progress tracking
+            if required_monthly <= available_for_goal:
+                st.markdown(f"""
+                <div class="success-card">
+                    <h4>🎉 Goal Strategy Approved!</h4>
+                    <p><strong>Monthly Allocation:</strong> {required_monthly_str} from your {adjusted_savings_str} savings budget</p>
+                    <p><strong>Timeline:</strong> {goal_timeline} | <strong>Achievement Date:</strong> {(_NOW + timedelta(days=months*30)).strftime('%B %Y')}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                # Alternative suggestions
+                realistic_timeline = goal_amount / available_for_goal
+                st.markdown(f"""
+                <div class="warning-card">
+                    <h4>💡 Alternative Suggestions</h4>
+                    <p><strong>Option 1:</strong> Extend timeline to {realistic_timeline:.1f} months</p>
+                    <p><strong>Option 2:</strong> Reduce goal to {format_currency(available_for_goal * months, 0)}</p>
+                    <p><strong>Option 3:</strong> Increase income or reduce other expenses</p>
+                </div>
+                """, unsafe_allow_html=True)
         
-        # Goal progress tracking
-        if required_monthly <= available_for_goal:
-            st.markdown(f"""
-            <div class="success-card">
-                <h4>🎉 Goal Strategy Approved!</h4>
-                <p><strong>Monthly Allocation:</strong> {format_currency(required_monthly, 0)} from your {format_currency(adjusted_savings, 0)} savings budget</p>
-                <p><strong>Timeline:</strong> {goal_timeline} | <strong>Achievement Date:</strong> {(datetime.now() + timedelta(days=months*30)).strftime('%B %Y')}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            # Alternative suggestions
-            realistic_timeline = goal_amount / available_for_goal
-            st.markdown(f"""
-            <div class="warning-card">
-                <h4>💡 Alternative Suggestions</h4>
-                <p><strong>Option 1:</strong> Extend timeline to {realistic_timeline:.1f} months</p>
-                <p><strong>Option 2:</strong> Reduce goal to {format_currency(available_for_goal * months, 0)}</p>
-                <p><strong>Option 3:</strong> Increase income or reduce other expenses</p>
-            </div>
-            """, unsafe_allow_html=True)
+    _goal_planner_section(adjusted_savings, adjusted_savings_str)
 
     # =============================================================================
     # WEALTH BUILDING PROJECTIONS
@@ -3402,30 +3746,29 @@ if total_monthly_income > 0:
     if available_for_investment > 0:
         st.markdown("#### 📈 Investment Growth Projections (7% Annual Return)")
         
-        cols = st.columns(len(years_projections))
-        
-        for i, years in enumerate(years_projections):
-            # Future value calculation: FV = PMT * [((1+r)^n - 1) / r]
-            monthly_investment = available_for_investment
-            monthly_rate = investment_return / 12
-            months = years * 12
-            
-            future_value = monthly_investment * (((1 + monthly_rate) ** months - 1) / monthly_rate)
-            total_contributions = monthly_investment * months
-            investment_growth = future_value - total_contributions
-            
-            with cols[i]:
-                st.markdown(f"""
-                <div class="slay-card">
-                    <h4>💰 {years} Year Projection</h4>
-                    <h2>{format_currency(future_value, 0)}</h2>
-                    <div style="font-size: 0.8em; margin-top: 10px;">
-                        <p>Contributions: {format_currency(total_contributions, 0)}</p>
-                        <p>Growth: {format_currency(investment_growth, 0)}</p>
-                        <p>Monthly: {format_currency(monthly_investment, 0)}</p>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+        # Future value calculation: FV = PMT * [((1+r)^n - 1) / r], for every horizon in one vector op,
+        # with (1+r)^n - 1 evaluated as expm1(n * log1p(r)) from a single hoisted log
+        monthly_investment = available_for_investment
+        monthly_rate = investment_return / 12
+        log1p_rate = math.log1p(monthly_rate)
+        projection_months = np.array(years_projections) * 12
+        
+        future_values = monthly_investment * (np.expm1(projection_months * log1p_rate) / monthly_rate)
+        contributions = monthly_investment * projection_months
+        growths = future_values - contributions
+        
+        projection_cards = []
+        for years, future_value, total_contributions, investment_growth in zip(
+            years_projections, future_values, contributions, growths
+        ):
+            projection_cards.append(_PROJECTION_CARD_TMPL.format(
+                years=years,
+                future_value=format_currency(future_value, 0),
+                contributions=format_currency(total_contributions, 0),
+                growth=format_currency(investment_growth, 0),
+                monthly=available_for_investment_str
+            ))
+        _card_row(projection_cards, len(years_projections))
     
     # Net worth milestones
     st.markdown("#### 🎯 Net Worth Milestones by Age")
@@ -3437,34 +3780,28 @@ if total_monthly_income > 0:
     # Rule of thumb: net worth should be 1x annual income by 30, 3x by 40
     milestone_multipliers = {30: 1, 35: 3, 40: 5}
     
-    cols = st.columns(len(target_ages))
+    years_to_ages = [target_age - current_age for target_age in target_ages]
+    projected_net_worths = _milestone_net_worths(
+        current_savings_amount, adjusted_savings, available_for_investment, investment_return, years_to_ages
+    )
     
-    for i, target_age in enumerate(target_ages):
-        years_to_age = target_age - current_age
+    milestone_cards = []
+    for target_age, years_to_age, projected_net_worth in zip(target_ages, years_to_ages, projected_net_worths):
         target_multiplier = milestone_multipliers.get(target_age, target_age - 25)
         target_net_worth = annual_income * target_multiplier
         
         # Calculate if current savings rate will achieve this
         if years_to_age > 0 and adjusted_savings > 0:
-            projected_savings = current_savings_amount + (adjusted_savings * 12 * years_to_age)
-            # Assuming some investment growth
-            projected_investments = available_for_investment * 12 * years_to_age * (1 + investment_return) ** years_to_age if available_for_investment > 0 else 0
-            projected_net_worth = projected_savings + projected_investments
-            
             achievement_status = "✅ On Track" if projected_net_worth >= target_net_worth else "⚠️ Need Boost"
         else:
             achievement_status = "🎯 Future Goal"
             projected_net_worth = 0
         
-        with cols[i]:
-            st.markdown(f"""
-            <div class="milestone-badge" style="display: block; margin: 10px 0; padding: 15px;">
-                <h4>Age {target_age} Goal</h4>
-                <h3>{format_currency(target_net_worth, 0)}</h3>
-                <p>{target_multiplier}x Annual Income</p>
-                <small>{achievement_status}</small>
-            </div>
-            """, unsafe_allow_html=True)
+        milestone_cards.append(_MILESTONE_CARD_TMPL.format(
+            age=target_age, target=format_currency(target_net_worth, 0),
+            multiplier=target_multiplier, status=achievement_status
+        ))
+    _card_row(milestone_cards, len(target_ages))
 
     # =============================================================================
     # ACTIONABLE NEXT STEPS & RECOMMENDATIONS
@@ -3474,71 +3811,39 @@ if total_monthly_income > 0:
     
     col1, col2 = st.columns(2)
     
+    # Bullet blocks are cached on their inputs and each rendered with one st.markdown call
     with col1:
         st.markdown("#### 🚨 Immediate Actions (This Week)")
-        immediate_actions = []
-        
-        if current_savings_amount < 1000:
-            immediate_actions.append("🏦 Open high-yield savings account (Marcus, Ally, Capital One)")
-            immediate_actions.append("💰 Set up automatic transfer of $50-100/week to savings")
-        
-        if monthly_debt_payment > 0 and debt_payoff_extra > 0:
-            immediate_actions.append("📞 Call credit card companies to negotiate lower rates")
-            immediate_actions.append("💳 Set up automatic extra payments to highest interest debt")
-        
-        if available_for_investment > 100:
-            immediate_actions.append("📊 Open investment account (Fidelity, Vanguard, or Schwab)")
-            immediate_actions.append("🤖 Set up automatic investing in index funds")
-        
-        immediate_actions.append("📱 Download budgeting app (Mint, YNAB, or PocketGuard)")
-        immediate_actions.append("🔍 Review and cancel unused subscriptions")
-        
-        for action in immediate_actions[:5]:
-            st.markdown(f"• {action}")
+        st.markdown(_immediate_actions_markdown(
+            current_savings_amount < 1000,
+            monthly_debt_payment > 0 and debt_payoff_extra > 0,
+            available_for_investment > 100
+        ))
     
     with col2:
         st.markdown("#### 📅 30-Day Goals")
-        monthly_goals = []
-        
-        if emergency_progress < 100:
-            monthly_goals.append(f"🛡️ Save {format_currency(emergency_monthly_need, 0)} for emergency fund")
-        
-        monthly_goals.append(f"📊 Track all expenses and stay within {format_currency(wants_amount, 0)} fun budget")
-        monthly_goals.append(f"💰 Automate {format_currency(adjusted_savings, 0)} monthly savings")
-        
-        if current_debt > 0:
-            monthly_goals.append(f"💳 Pay {format_currency(total_debt_payment, 0)} toward debt elimination")
-        
-        monthly_goals.append("📚 Read one personal finance book or take online course")
-        monthly_goals.append("🎯 Set up goal tracking for your biggest financial priority")
-        
-        for goal in monthly_goals:
-            st.markdown(f"• {goal}")
+        st.markdown(_monthly_goals_markdown(
+            format_currency(emergency_monthly_need, 0) if emergency_progress < 100 else None,
+            format_currency(wants_amount, 0),
+            adjusted_savings_str,
+            total_debt_payment_str if current_debt > 0 else None
+        ))
 
-# Quick Win Tips
-st.markdown("""
-<div class="vibe-card">
-    <h3>💡 Quick Wins for This Week</h3>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-top: 15px;">
-        <div style="background: rgba(255,255,255,0.2); padding: 15px; border-radius: 10px;">
-            <h4>🏦 Banking Hack</h4>
-            <p>Switch to a high-yield savings account earning 4%+ instead of 0.01% at big banks</p>
-        </div>
-        <div style="background: rgba(255,255,255,0.2); padding: 15px; border-radius: 10px;">
-            <h4>🤖 Automation</h4>
-            <p>Set up automatic transfers on payday - pay yourself first before you can spend it</p>
-        </div>
-        <div style="background: rgba(255,255,255,0.2); padding: 15px; border-radius: 10px;">
-            <h4>💳 Credit Boost</h4>
-            <p>Pay credit cards twice monthly instead of once to lower utilization and boost score</p>
-        </div>
-        <div style="background: rgba(255,255,255,0.2); padding: 15px; border-radius: 10px;">
-            <h4>📊 Track Everything</h4>
-            <p>Use apps like Mint or YNAB to see where every dollar goes - awareness = control</p>
-        </div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+# Quick Win Tips (static, so the whole block is assembled once into a constant)
+_QUICK_WINS = (
+    ("🏦 Banking Hack", "Switch to a high-yield savings account earning 4%+ instead of 0.01% at big banks"),
+    ("🤖 Automation", "Set up automatic transfers on payday - pay yourself first before you can spend it"),
+    ("💳 Credit Boost", "Pay credit cards twice monthly instead of once to lower utilization and boost score"),
+    ("📊 Track Everything", "Use apps like Mint or YNAB to see where every dollar goes - awareness = control"),
+)
+_QUICK_WIN_TMPL = '<div style="background: rgba(255,255,255,0.2); padding: 15px; border-radius: 10px;"><h4>{t}</h4><p>{b}</p></div>'
+_QUICK_WINS_HTML = (
+    '<div class="vibe-card"><h3>💡 Quick Wins for This Week</h3>'
+    '<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-top: 15px;">'
+    + "".join(_QUICK_WIN_TMPL.format(t=t, b=b) for t, b in _QUICK_WINS)
+    + '</div></div>'
+)
+st.markdown(_QUICK_WINS_HTML, unsafe_allow_html=True)
 
 # 🚨 MAIN ERROR: format_currency function is not defined
 # FIX: Replace format_currency with standard Python formatting
@@ -3566,12 +3871,487 @@ st.markdown(f"""
 
 # Note: current_page is already defined at the top after sidebar
 
+# Static tier-2 page data as literal tuples, which compile to constants instead of
+# being rebuilt on every rerun
+
+# Life events as (event, expense_change, income_stability, travel_change, timeline)
+_LIFE_EVENTS = (
+    ("💍 Get Married", 0.40, -0.20, 0.50, "2 years"),
+    ("👶 Have a Baby", 0.60, -0.30, -0.40, "3 years"),
+    ("🏠 Buy a House", 0.35, 0.10, -0.20, "5 years"),
+    ("💼 Job Loss", -0.10, -0.80, -0.70, "6 months"),
+    ("📈 Get Promoted", 0.15, 0.30, 0.25, "1 year"),
+    ("🎓 Go Back to School", 0.50, -0.50, -0.30, "2 years"),
+    ("📉 Recession Hits", -0.05, -0.40, -0.50, "2 years"),
+    ("🚗 Buy a Car", 0.20, 0.0, 0.10, "Now"),
+    ("✈️ Year of Travel", 0.80, -0.60, 1.0, "1 year"),
+    ("🏥 Medical Emergency", 0.90, -0.30, -0.80, "6 months"),
+)
+
+# One ripple-effect row per selected event; %+.0f signs the percentages itself
+_RIPPLE_TMPL = (
+    "<div style='background: linear-gradient(135deg, #f5f7fa 0%%, #c3cfe2 100%%); padding: 1rem; border-radius: 10px; margin: 0.5rem 0; color: #2d3748;'>"
+    "<strong>%s</strong> → %s Expenses %+.0f%% | %s Income Stability %+.0f%% | 📅 Timeline: %s"
+    "</div>"
+)
+
+# Life-event impacts as an (events x [expense, stability, travel]) matrix, so any set of
+# scenarios can be scored with one matrix product
+_EVENT_IMPACTS = np.array([event[1:4] for event in _LIFE_EVENTS])
+
+def _score_scenarios(impacts, masks, monthly_income):
+    """Whole-percent success rate, months to broke and stability for each row of a (scenarios x events) mask"""
+    masks = np.asarray(masks, dtype=np.float64)
+    expense_change, stability_change, _ = (masks @ impacts).T
+    event_counts = masks.sum(axis=1)
+    
+    new_monthly_expenses = monthly_income * 0.7 * (1 + expense_change)
+    stability = np.clip(70 + stability_change * 100, 0, 100)
+    deficit = new_monthly_expenses - monthly_income
+    months_to_broke = np.full(deficit.shape, 999.0)
+    np.divide(monthly_income * 3, deficit, out=months_to_broke, where=deficit > 0)
+    # Rates are displayed as whole percents, and 0-100 fits uint8 at an eighth of float64's size
+    success_rates = np.rint(np.clip(85 - event_counts * 8 + stability / 10, 0, 100)).astype(np.uint8)
+    return success_rates, months_to_broke, stability
+
+# Spending patterns as parallel columns
+_PATTERN_NAMES = ("Friday Night Splurge", "End of Month YOLO", "Payday Celebration", "Late Night Shopping")
+_PATTERN_AMOUNTS = np.array([180, 450, 320, 95])
+_PATTERN_FREQUENCIES = ("Weekly", "Monthly", "Bi-weekly", "3x/week")
+_PATTERN_TRENDS = ("📈 +12% this month", "📈 +8% vs last month", "📉 -5% (improving!)", "📈 +23% (uh oh!)")
+
+# Subscriptions as parallel columns, with the monthly totals summed once up front
+_SUB_NAMES = ("Netflix", "Spotify Premium", "Adobe Creative Cloud", "ChatGPT Pro",
+              "Gym Membership", "iCloud Storage", "LinkedIn Premium", "Headspace")
+_SUB_COSTS = np.array([15.99, 9.99, 54.99, 20.00, 49.99, 2.99, 29.99, 12.99])
+_SUB_LAST_USED = ("2 weeks ago", "Yesterday", "3 months ago", "Today",
+                  "6 months ago", "Daily (auto)", "2 months ago", "1 month ago")
+_SUB_WORTH = np.array([True, True, False, True, False, True, False, False])
+_TOTAL_SUBS = float(_SUB_COSTS.sum())
+_WASTED = float(_SUB_COSTS[~_SUB_WORTH].sum())
+
+# Spending anomalies as parallel columns (normal and current monthly spend, change %)
+_ANOMALY_CATEGORIES = ("Groceries", "Dining Out", "Transport")
+_ANOMALY_NORMAL = np.array([450, 200, 150])
+_ANOMALY_CURRENT = np.array([630, 380, 220])
+_ANOMALY_CHANGE = np.array([40, 90, 47])
+_ANOMALY_REASONS = ("Inflation or behavior change?", "Dating season? 💕", "Gas prices or more trips?")
+
+# Income types and their base stability scores, matched by position
+_INCOME_TYPES = ("Full-time Salary", "Freelance/Gig", "Mixed Income", "Business Owner")
+_STABILITY_BASE = (85, 45, 65, 55)
+_FORECAST_MONTHS = ('Month 1', 'Month 2', 'Month 3', 'Month 4', 'Month 5', 'Month 6')
+
+# Stability score tiers, looked up with bisect_right so each label applies from its threshold up
+_GRADE_THRESHOLDS = (40, 50, 60, 70, 80, 90)
+_GRADE_LABELS = ("D", "C", "C+", "B", "B+", "A", "A+")
+# Borrowing tiers as (grade colour, income multiple, message)
+_LOAN_THRESHOLDS = (50, 70)
+_LOAN_TIERS = (
+    ("#e74c3c", 12, "Limited borrowing power - consider building stability first"),
+    ("#f39c12", 24, "Decent borrowing power, but rates may be higher"),
+    ("#11998e", 48, "Banks love you! High stability = great loan terms"),
+)
+# Negotiation tiers as (power, salary multiple)
+_NEGOTIATION_THRESHOLDS = (50, 75)
+_NEGOTIATION_TIERS = (("LOW", 1.05), ("MEDIUM", 1.10), ("HIGH", 1.15))
+
+@st.cache_data(max_entries=256)
+def _whatif_cards_html(success_pct, best_case, worst_case, confidence_pct, currency):
+    """Success / best / worst / confidence card HTML; `currency` keys the cached amount formatting"""
+    best_case, worst_case = format_currency(best_case, 0), format_currency(worst_case, 0)
+    return (f"""
+<div class='impact-card' style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);'>
+    <h3>🎯 Success Rate</h3>
+    <h1 style='font-size: 3rem; margin: 0;'>{success_pct}%</h1>
+    <p>Will you reach your goal?</p>
+</div>
+""", f"""
+<div class='impact-card' style='background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); color: #2d3748;'>
+    <h3>💚 Best Case</h3>
+    <h1 style='font-size: 2rem; margin: 0;'>{best_case}</h1>
+    <p>5-year wealth (optimistic)</p>
+</div>
+""", f"""
+<div class='impact-card' style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);'>
+    <h3>💔 Worst Case</h3>
+    <h1 style='font-size: 2rem; margin: 0;'>{worst_case}</h1>
+    <p>5-year wealth (pessimistic)</p>
+</div>
+""", f"""
+<div class='impact-card' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);'>
+    <h3>🧠 Confidence</h3>
+    <h1 style='font-size: 3rem; margin: 0;'>{confidence_pct}%</h1>
+    <p>Model certainty</p>
+</div>
+""")
+
+@st.cache_data(max_entries=256)
+def _success_figure(base_prob):
+    """Success-probability curve for a whole-percent starting rate, as a plain figure dict"""
+    months = np.arange(1, 61)
+    probabilities = np.maximum(10.0, base_prob - 0.3 * months + _rng.uniform(-2, 2, months.size))
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=months, y=probabilities,
+        mode='lines+markers',
+        line=dict(color='#667eea', width=3),
+        marker=dict(size=4),
+        fill='tozeroy',
+        fillcolor='rgba(102, 126, 234, 0.2)'
+    ))
+    fig.update_layout(
+        title="Your Financial Success Probability (Next 5 Years)",
+        xaxis_title="Months",
+        yaxis_title="Success Probability (%)",
+        template="plotly_white",
+        height=400
+    )
+    return fig.to_dict()
+
+@st.cache_data(max_entries=256)
+def _income_forecast_figure(income_type, monthly_income):
+    """6-month income forecast bar chart for an income profile, as a plain figure dict"""
+    if income_type == "Full-time Salary":
+        low, high = -0.02, 0.03
+        trend = "Stable - Predictable growth trajectory"
+    else:
+        low, high = -0.3, 0.4
+        trend = "Variable - High volatility expected"
+    forecast = monthly_income * (1 + _rng.uniform(low, high, len(_FORECAST_MONTHS)))
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=_FORECAST_MONTHS, y=forecast, marker_color='#667eea'))
+    fig.add_hline(y=monthly_income, line_dash="dash", line_color="red", annotation_text="Average")
+    fig.update_layout(title=f"Projected Income: {trend}", height=300, template="plotly_white")
+    return fig.to_dict()
+
+# Hash the static column arrays by dtype, shape and raw bytes so the card caches hit on content
+_ARRAY_HASH_FUNCS = {np.ndarray: lambda a: (a.dtype.str, a.shape, a.tobytes())}
+
+@st.cache_data(hash_funcs=_ARRAY_HASH_FUNCS, max_entries=64)
+def _pattern_cards_html(names, amounts, frequencies, trends):
+    """Hidden-pattern cards, one per spending pattern column entry"""
+    return tuple(f"""
+<div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.3rem; border-radius: 12px; margin: 0.7rem 0; box-shadow: 0 4px 12px rgba(0,0,0,0.15);'>
+    <div style='color: white; font-weight: 700; font-size: 1.1rem;'>{pattern}</div>
+    <div style='color: #FFE8E8; font-size: 1.3rem; font-weight: 800; margin: 0.5rem 0;'>${amount}</div>
+    <div style='color: rgba(255,255,255,0.9); font-size: 0.95rem;'>{frequency} | {trend}</div>
+</div>
+""" for pattern, amount, frequency, trend in zip(names, amounts, frequencies, trends))
+
+@st.cache_data(hash_funcs=_ARRAY_HASH_FUNCS, max_entries=64)
+def _anomaly_cards_html(categories, normal, current, change, reasons):
+    """Anomaly alarm cards, one per category column entry"""
+    return tuple(f"""
+<div style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center;'>
+    <h4>{category}</h4>
+    <p style='margin: 0;'>Normal: ${normal_amount}</p>
+    <h2 style='margin: 0.5rem 0;'>Now: ${current_amount}</h2>
+    <p style='font-size: 1.5rem; margin: 0;'>📈 +{change_pct}%</p>
+    <p style='opacity: 0.9; font-size: 0.9rem;'>{reason}</p>
+</div>
+""" for category, normal_amount, current_amount, change_pct, reason in zip(categories, normal, current, change, reasons))
+
+@st.cache_data
+def _leaky_bucket_figure():
+    """Static 'where does your money go' funnel, built once as a plain figure dict"""
+    fig = go.Figure(go.Funnel(
+        y = ["Income", "After Bills", "After Subscriptions", "After Hidden Leaks", "What's Left"],
+        x = [5000, 3500, 3300, 2800, 2500],
+        textposition = "inside",
+        textinfo = "value+percent initial",
+        marker=dict(color=["#667eea", "#764ba2", "#f093fb", "#f5576c", "#11998e"])
+    ))
+    fig.update_layout(title="Where Does Your Money Go?", height=400)
+    return fig.to_dict()
+
+@st.cache_data(max_entries=256)
+def _subscription_card_html(name, cost, last_used, worth_it):
+    """One subscription graveyard row, green when it's worth keeping"""
+    status = "🟢" if worth_it else "🔴"
+    cancel_btn = "" if worth_it else " [CANCEL?]"
+    row_class = "sub-good" if worth_it else "sub-bad"
+    return f"""
+<div class='{row_class}'>
+    {status} <strong style='font-size: 1.1rem;'>{name}</strong><br/>
+    <span style='font-size: 1.2rem; font-weight: 700;'>${cost}/mo</span> | Last used: {last_used}<span style='font-weight: bold;'>{cancel_btn}</span>
+</div>
+"""
+
+@st.cache_data(max_entries=256)
+def _grade_card_html(grade, grade_color, score):
+    """Income stability grade card for a whole-number score"""
+    return f"""
+<div style='background: linear-gradient(135deg, {grade_color} 0%, {grade_color}aa 100%); padding: 2rem; border-radius: 20px; color: white; text-align: center;'>
+    <h2>Income Stability Grade</h2>
+    <h1 style='font-size: 6rem; margin: 0;'>{grade}</h1>
+    <h3>Score: {score}/100</h3>
+</div>
+"""
+
+@st.cache_data(max_entries=256)
+def _loan_card_html(max_loan, loan_message, currency):
+    """Safe borrowing limit card; `currency` keys the cached amount formatting"""
+    max_loan = format_currency(max_loan, 0)
+    return f"""
+<div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-top: 1rem;'>
+    <h3>Safe Borrowing Limit</h3>
+    <h1 style='font-size: 2.5rem; margin: 0;'>{max_loan}</h1>
+    <p style='opacity: 0.9;'>{loan_message}</p>
+</div>
+"""
+
+# Yearly inflation per spending category, and the one the Quick Fix targets
+_InflationCategory = namedtuple('_InflationCategory', 'name inflation status')
+_INFLATION_CATEGORIES = (
+    _InflationCategory("🍕 Food", 12, "danger"),
+    _InflationCategory("🎬 Entertainment", 8, "warning"),
+    _InflationCategory("📱 Subscriptions", 15, "danger"),
+    _InflationCategory("👗 Shopping", 20, "danger"),
+    _InflationCategory("🚗 Transport", 5, "ok"),
+    _InflationCategory("🏠 Housing", 3, "ok"),
+)
+_WORST_INFLATION_CATEGORY = max(_INFLATION_CATEGORIES, key=attrgetter('inflation'))
+
+# Stress Heat Map calendar: (month, stress profile) in calendar order
+_STRESS_MONTHS = (
+    ("January", {"stress": 65, "reasons": ["New Year spending hangover", "Holiday credit card bills"], "color": "#f39c12"}),
+    ("February", {"stress": 45, "reasons": ["Valentine's Day expenses", "Tax prep stress"], "color": "#f1c40f"}),
+    ("March", {"stress": 40, "reasons": ["Spring break temptation", "End of Q1"], "color": "#2ecc71"}),
+    ("April", {"stress": 80, "reasons": ["TAX DEADLINE 📋", "Spring shopping"], "color": "#e74c3c"}),
+    ("May", {"stress": 55, "reasons": ["Mother's Day", "Wedding season starts"], "color": "#f39c12"}),
+    ("June", {"stress": 50, "reasons": ["Summer vacation planning", "Mid-year review"], "color": "#f1c40f"}),
+    ("July", {"stress": 45, "reasons": ["Summer activities", "Holiday spending"], "color": "#2ecc71"}),
+    ("August", {"stress": 60, "reasons": ["Back to school", "End of summer splurge"], "color": "#f39c12"}),
+    ("September", {"stress": 35, "reasons": ["Fresh start energy", "Fall reset"], "color": "#2ecc71"}),
+    ("October", {"stress": 55, "reasons": ["Halloween prep", "Holiday planning starts"], "color": "#f39c12"}),
+    ("November", {"stress": 75, "reasons": ["Black Friday FOMO", "Thanksgiving travel"], "color": "#e74c3c"}),
+    ("December", {"stress": 90, "reasons": ["Holiday shopping madness", "Year-end expenses", "Travel costs"], "color": "#e74c3c"}),
+)
+# High-stress months keyed by calendar number (1-12), filtered once at import
+_HIGH_STRESS = tuple((index, month, data) for index, (month, data) in enumerate(_STRESS_MONTHS, 1) if data['stress'] >= 70)
+_STRESS_EMOJI = tuple("🟢" if data['stress'] < 50 else "🟡" if data['stress'] < 70 else "🔴" for _, data in _STRESS_MONTHS)
+# The heat-map cells never change, so the whole grid's cards are rendered at import
+_STRESS_MONTH_CARDS = tuple(f"""
+<div style='background: {data['color']}; padding: 1rem; border-radius: 10px; text-align: center; color: white; margin: 0.3rem 0; min-height: 100px;'>
+    <strong>{month[:3]}</strong><br/>
+    <span style='font-size: 1.5rem;'>{stress_emoji}</span><br/>
+    <small>{data['stress']}%</small>
+</div>
+""" for (month, data), stress_emoji in zip(_STRESS_MONTHS, _STRESS_EMOJI))
+
+@lru_cache(maxsize=12)
+def _next_stressful_after(month_index):
+    """First high-stress (month, profile) from the given calendar month onward, or None"""
+    return next(((month, data) for index, month, data in _HIGH_STRESS if index >= month_index), None)
+
+# Category inflation card background and icon by status
+_INFLATION_STATUS_BG = {
+    'danger': "linear-gradient(135deg, #ff6b6b 0%, #ff5252 100%)",
+    'warning': "linear-gradient(135deg, #ffa500 0%, #ffb84d 100%)",
+    'ok': "linear-gradient(135deg, #51cf66 0%, #40c057 100%)",
+}
+_INFLATION_STATUS_ICON = {'danger': "🔴", 'warning': "🟡", 'ok': "🟢"}
+_INFLATION_CATEGORY_RENDER = tuple(
+    (cat, _INFLATION_STATUS_BG[cat.status], _INFLATION_STATUS_ICON[cat.status]) for cat in _INFLATION_CATEGORIES
+)
+_INFLATION_CATEGORY_CARDS = tuple(f"""
+<div style='background: {bg}; padding: 1.2rem; border-radius: 12px; margin: 0.8rem 0; box-shadow: 0 4px 12px rgba(0,0,0,0.1);'>
+    <div style='color: white; font-size: 1.1rem; font-weight: 600;'>
+        {icon} <strong>{cat.name}</strong>: <span style='font-size: 1.3rem; font-weight: 700;'>+{cat.inflation}%/year</span>
+    </div>
+</div>
+""" for cat, bg, icon in _INFLATION_CATEGORY_RENDER)
+
+# Inflation Detector and Stress Predictor card templates, built once and filled with str.format
+_CLOCK_TMPL = """
+<div style='background: {color}; padding: 3rem; border-radius: 20px; color: white; text-align: center;'>
+    <h2>⏰ TIME UNTIL BROKE</h2>
+    <h1 style='font-size: 5rem; margin: 0;'>{years:.1f}</h1>
+    <h2>YEARS</h2>
+    <p style='opacity: 0.9;'>At current spending trajectory</p>
+</div>
+"""
+_QUICK_FIX_TMPL = """
+<div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 1rem; border-radius: 15px; color: white; text-align: center; margin-top: 1rem;'>
+    <h4>💡 Quick Fix</h4>
+    <p>Cut {category} by 50%</p>
+    <h3>Save {save}/mo</h3>
+</div>
+"""
+_FUN_BUDGET_TMPL = """
+<div style='background: #f8f9fa; padding: 1.5rem; border-radius: 15px; text-align: center;'>
+    <h4>Current Fun Budget</h4>
+    <h2>{budget}</h2>
+</div>
+"""
+_NEW_CAP_TMPL = """
+<div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 15px; text-align: center; color: white;'>
+    <h4>Suggested New Cap</h4>
+    <h2>{cap}</h2>
+    <p style='opacity: 0.8;'>(-{reduction:.0f}% reduction)</p>
+</div>
+"""
+_STRESS_ALERT_TMPL = """
+<div style='background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%); padding: 1.5rem; border-radius: 15px; color: white;'>
+    <h3>⚠️ {month} Stress Alert!</h3>
+    <p><strong>Expected extra expenses:</strong> {cost}</p>
+    <h4>Why?</h4>
+    <ul>
+        {reasons}
+    </ul>
+    <p style='opacity: 0.9;'>Your current savings may not cover this → Stress incoming!</p>
+</div>
+"""
+_DECEMBER_FUND_TMPL = """
+<div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1rem;'>
+    <h4>🎄 December Fund Progress</h4>
+    <p>Target: {target} for holiday expenses</p>
+    <p>Start saving: <strong>November 1st</strong></p>
+    <p>Monthly contribution needed: <strong>{monthly}</strong></p>
+    <div style='background: rgba(255,255,255,0.3); height: 20px; border-radius: 10px; overflow: hidden; margin-top: 10px;'>
+        <div style='background: white; height: 100%; width: 35%;'></div>
+    </div>
+    <p style='text-align: center; margin-top: 5px;'>35% funded | 🎯 On Track!</p>
+</div>
+"""
+_INTERVENTION_TMPL = """
+<div style='background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); padding: 1.5rem; border-radius: 15px; color: #2d3748;'>
+    <h3>💬 Hey there! I detected some financial stress coming your way.</h3>
+    <p>Let's build a plan together. Here are some quick wins:</p>
+    <div style='background: white; padding: 1rem; border-radius: 10px; margin: 1rem 0;'>
+        <p>☕ Skip 1 coffee this week = <strong>{coffee}</strong> toward your goal</p>
+        <p>🎬 Movie night at home instead = <strong>{movie}</strong> saved</p>
+        <p>🍽️ Cook one extra meal = <strong>{meal}</strong> in your pocket</p>
+    </div>
+    <p style='text-align: center;'>Small actions = Big stress relief! 💪</p>
+</div>
+"""
+
+@lru_cache(maxsize=16)
+def _intervention_card_html(currency_code):
+    """Intervention card with its fixed savings amounts, formatted once per display currency"""
+    return _INTERVENTION_TMPL.format(coffee=format_currency(25, 0), movie=format_currency(40, 0), meal=format_currency(30, 0))
+
+@st.cache_data(max_entries=128)
+def _project_wealth(monthly_income, income_growth, spending_growth):
+    """Wealth now and after each of the next 5 years for the given annual growth rates (%)"""
+    years = np.arange(6, dtype=np.float64)
+    income = monthly_income * 12 * np.power(1 + income_growth/100, years)
+    spending = monthly_income * 12 * 0.8 * np.power(1 + spending_growth/100, years)
+    # Year 0 is the starting balance; later years add that year's net, accumulated in order
+    flows = income - spending
+    flows[0] = monthly_income * 12 * 0.2
+    return np.cumsum(flows)
+
+_WEALTH_STAGES = ("Now (Fine)", "Year 1", "Year 2 (Stress)", "Year 3 (Crisis)", "Year 4", "Year 5 (Broke?)")
+
+@st.cache_data(max_entries=128)
+def _wealth_journey_figure(monthly_income, income_growth, spending_growth):
+    """Five-year wealth bar chart, built and serialized only on a cache miss"""
+    wealth = _project_wealth(monthly_income, income_growth, spending_growth)
+    fig = go.Figure()
+    colors = ['#11998e' if w > 0 else '#ff416c' for w in wealth]
+    fig.add_trace(go.Bar(x=_WEALTH_STAGES, y=wealth, marker_color=colors))
+    fig.add_hline(y=0, line_color="red", line_width=3)
+    fig.update_layout(title="Your Wealth Journey", height=350, template="plotly_white", hovermode=False)
+    return fig.to_dict()
+
+# Gauges are read-only, so plotly.js can skip hover and zoom wiring
+_STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+# Trend lines keep hover tooltips but drop the modebar and wheel zoom
+_INTERACTIVE_CHART_CONFIG = {'displayModeBar': False, 'scrollZoom': False}
+
+@st.cache_data(max_entries=256)
+def _inflation_gauge_figure(speed, income_growth):
+    """Spending-inflation speedometer for a growth rate against the income growth reference"""
+    zone = "CRASH ZONE 💥" if speed > 15 else "DANGER ZONE ⚠️" if speed > 10 else "CAUTION 🟡" if speed > 5 else "SAFE ZONE ✅"
+    gauge_color = "#ff416c" if speed > 15 else "#f39c12" if speed > 10 else "#ffc107" if speed > 5 else "#11998e"
+    
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = speed,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': f"Spending Inflation Rate<br><span style='font-size:0.8em;color:{gauge_color}'>{zone}</span>"},
+        delta = {'reference': income_growth, 'relative': False, 'position': "bottom"},
+        gauge = {
+            'axis': {'range': [0, 30], 'tickwidth': 1},
+            'bar': {'color': gauge_color},
+            'bgcolor': "white",
+            'steps': [
+                {'range': [0, 5], 'color': '#e8f5e9'},
+                {'range': [5, 10], 'color': '#fff3e0'},
+                {'range': [10, 15], 'color': '#ffebee'},
+                {'range': [15, 30], 'color': '#ffcdd2'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': income_growth
+            }
+        }
+    ))
+    fig.update_layout(height=350)
+    return fig.to_dict()
+
+@st.cache_data(max_entries=128)
+def _wellness_gauge_figure(financial_wellness):
+    """Financial wellness gauge for a 0-100 score"""
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = financial_wellness,
+        title = {'text': "Financial Wellness Score"},
+        gauge = {
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "#667eea"},
+            'steps': [
+                {'range': [0, 40], 'color': "#ffcdd2"},
+                {'range': [40, 70], 'color': "#fff9c4"},
+                {'range': [70, 100], 'color': "#c8e6c9"}
+            ]
+        }
+    ))
+    fig.update_layout(height=250)
+    return fig.to_dict()
+
+@st.cache_data
+def _stress_levels(week_stamp, n_weeks):
+    """Simulated weekly stress levels, seeded by the calendar week so the trend holds still all week"""
+    return np.random.default_rng(week_stamp).integers(30, 81, size=n_weeks)
+
+_TREND_MAX_POINTS = 500
+
+def _bucket_means(x, y, max_points=_TREND_MAX_POINTS):
+    """Average y over at most max_points equal buckets, labelled by each bucket's first x"""
+    if len(y) <= max_points:
+        return x, y
+    starts = np.linspace(0, len(y), max_points + 1).astype(np.intp)
+    return [x[i] for i in starts[:-1]], np.add.reduceat(y, starts[:-1]) / np.diff(starts)
+
+@st.cache_data
+def _stress_trend_figure(week_stamp, weeks):
+    """Weekly stress line for the given week labels, bucketed if the history grows past the point cap"""
+    trend_x, trend_y = _bucket_means(weeks, _stress_levels(week_stamp, len(weeks)))
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=trend_x, y=trend_y,
+        mode='lines+markers',
+        line=dict(color='#667eea', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(102, 126, 234, 0.2)'
+    ))
+    fig.add_hline(y=50, line_dash="dash", line_color="orange", annotation_text="Stress Threshold")
+    fig.update_layout(title="Your Stress Levels (Last 12 Weeks)", height=300, template="plotly_white")
+    return fig.to_dict()
+
 # =============================================================================
 # FEATURE 6: WHAT-IF FINANCIAL SIMULATOR
 # =============================================================================
 if current_page == "🎯 What-If Simulator":
     st.markdown("""
-    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 2rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;'>
+    <div class='page-banner' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);'>
         <h1 style='color: white; margin: 0;'>🎯 Life Event Impact Matrix</h1>
         <p style='color: rgba(255,255,255,0.9); font-size: 1.2rem;'>What if your life changes? See how major events reshape your financial future</p>
     </div>
@@ -3579,144 +4359,106 @@ if current_page == "🎯 What-If Simulator":
     
     monthly_income = st.session_state.financial_profile.get('monthly_income', 5000) if st.session_state.financial_profile else 5000
     
-    st.markdown("### 📅 Select Life Events (Like Instagram Stories!)")
-    
-    life_events = {
-        "💍 Get Married": {"expense_change": 0.40, "income_stability": -0.20, "travel_change": 0.50, "timeline": "2 years"},
-        "👶 Have a Baby": {"expense_change": 0.60, "income_stability": -0.30, "travel_change": -0.40, "timeline": "3 years"},
-        "🏠 Buy a House": {"expense_change": 0.35, "income_stability": 0.10, "travel_change": -0.20, "timeline": "5 years"},
-        "💼 Job Loss": {"expense_change": -0.10, "income_stability": -0.80, "travel_change": -0.70, "timeline": "6 months"},
-        "📈 Get Promoted": {"expense_change": 0.15, "income_stability": 0.30, "travel_change": 0.25, "timeline": "1 year"},
-        "🎓 Go Back to School": {"expense_change": 0.50, "income_stability": -0.50, "travel_change": -0.30, "timeline": "2 years"},
-        "📉 Recession Hits": {"expense_change": -0.05, "income_stability": -0.40, "travel_change": -0.50, "timeline": "2 years"},
-        "🚗 Buy a Car": {"expense_change": 0.20, "income_stability": 0.0, "travel_change": 0.10, "timeline": "Now"},
-        "✈️ Year of Travel": {"expense_change": 0.80, "income_stability": -0.60, "travel_change": 1.0, "timeline": "1 year"},
-        "🏥 Medical Emergency": {"expense_change": 0.90, "income_stability": -0.30, "travel_change": -0.80, "timeline": "6 months"}
-    }
-    
-    cols = st.columns(5)
-    selected_events = []
-    
-    for i, (event, impacts) in enumerate(life_events.items()):
-        with cols[i % 5]:
-            if st.checkbox(event, key=f"event_{i}"):
-                selected_events.append((event, impacts))
-    
-    if selected_events:
-        st.markdown("---")
-        st.markdown("### 🔮 Impact Analysis")
-        
-        total_expense_change = sum(e[1]['expense_change'] for e in selected_events)
-        total_stability_change = sum(e[1]['income_stability'] for e in selected_events)
-        total_travel_change = sum(e[1]['travel_change'] for e in selected_events)
-        
-        base_monthly = monthly_income * 0.7
-        new_monthly_expenses = base_monthly * (1 + total_expense_change)
-        stability_score = max(0, min(100, 70 + (total_stability_change * 100)))
-        
-        months_to_broke = 999
-        if new_monthly_expenses > monthly_income:
-            deficit = new_monthly_expenses - monthly_income
-            emergency_fund = monthly_income * 3
-            months_to_broke = emergency_fund / deficit if deficit > 0 else 999
+    @st.fragment
+    def _render_whatif_analysis(monthly_income):
+        """Life-event picker and impact analysis; submitting the picks reruns only this section"""
+        st.markdown("### 📅 Select Life Events (Like Instagram Stories!)")
+    
+        event_mask = np.zeros(len(_LIFE_EVENTS), dtype=bool)
+        # Picks are batched in a form, so the analysis reruns once per submit rather than per tick
+        with st.form("whatif"):
+            cols = st.columns(5)
+            for i, life_event in enumerate(_LIFE_EVENTS):
+                with cols[i % 5]:
+                    event_mask[i] = st.checkbox(life_event[0], key=f"event_{i}")
+            st.form_submit_button("🔮 Analyze Impact", type="primary", use_container_width=True)
+        selected_events = [_LIFE_EVENTS[i] for i in np.flatnonzero(event_mask)]
+    
+        if selected_events:
+            st.markdown("---")
+            st.markdown("### 🔮 Impact Analysis")
+        
+            # One column reduction over the impact matrix gives all three totals
+            total_expense_change, total_stability_change, total_travel_change = (
+                _EVENT_IMPACTS[event_mask].sum(axis=0).tolist()
+            )
         
-        success_rate = max(0, min(100, 85 - (len(selected_events) * 8) + (stability_score / 10)))
+            base_monthly = monthly_income * 0.7
+            new_monthly_expenses = base_monthly * (1 + total_expense_change)
+            stability_score = max(0, min(100, 70 + (total_stability_change * 100)))
         
-        col1, col2, col3, col4 = st.columns(4)
+            months_to_broke = 999
+            if new_monthly_expenses > monthly_income:
+                deficit = new_monthly_expenses - monthly_income
+                emergency_fund = monthly_income * 3
+                months_to_broke = emergency_fund / deficit if deficit > 0 else 999
         
-        with col1:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 1.5rem; border-radius: 15px; text-align: center; color: white;'>
-                <h3>🎯 Success Rate</h3>
-                <h1 style='font-size: 3rem; margin: 0;'>{success_rate:.0f}%</h1>
-                <p>Will you reach your goal?</p>
-            </div>
-            """, unsafe_allow_html=True)
+            success_rate = max(0, min(100, 85 - (len(selected_events) * 8) + (stability_score / 10)))
         
-        with col2:
             best_case = monthly_income * 12 * 5 * 1.15
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); padding: 1.5rem; border-radius: 15px; text-align: center; color: #2d3748;'>
-                <h3>💚 Best Case</h3>
-                <h1 style='font-size: 2rem; margin: 0;'>{format_currency(best_case, 0)}</h1>
-                <p>5-year wealth (optimistic)</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
             worst_case = max(0, monthly_income * 12 * 5 * (0.3 - total_expense_change))
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); padding: 1.5rem; border-radius: 15px; text-align: center; color: white;'>
-                <h3>💔 Worst Case</h3>
-                <h1 style='font-size: 2rem; margin: 0;'>{format_currency(worst_case, 0)}</h1>
-                <p>5-year wealth (pessimistic)</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
             confidence = max(20, 90 - (len(selected_events) * 12))
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 15px; text-align: center; color: white;'>
-                <h3>🧠 Confidence</h3>
-                <h1 style='font-size: 3rem; margin: 0;'>{confidence:.0f}%</h1>
-                <p>Model certainty</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        if len(selected_events) >= 2 and months_to_broke < 24:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%); padding: 1.5rem; border-radius: 15px; margin-top: 1rem; text-align: center; color: white;'>
-                <h2>⚠️ BREAKING POINT ALERT</h2>
-                <p style='font-size: 1.3rem;'>If {len(selected_events)} events happen together, you'll run out of money in <strong>{months_to_broke:.0f} months</strong>!</p>
-                <p>Consider building a bigger emergency fund or adjusting your timeline.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("### 📊 Success Probability Over Time")
+            # Whole percents (as the cards display them) keep the card cache keys few, and
+            # a hit skips the amount formatting as well
+            cards = _whatif_cards_html(round(success_rate), best_case, worst_case, round(confidence),
+                                       st.session_state.currency)
+            for col, card in zip(st.columns(4), cards):
+                with col:
+                    st.markdown(card, unsafe_allow_html=True)
+        
+            if len(selected_events) >= 2 and months_to_broke < 24:
+                st.markdown(f"""
+                <div style='background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%); padding: 1.5rem; border-radius: 15px; margin-top: 1rem; text-align: center; color: white;'>
+                    <h2>⚠️ BREAKING POINT ALERT</h2>
+                    <p style='font-size: 1.3rem;'>If {len(selected_events)} events happen together, you'll run out of money in <strong>{months_to_broke:.0f} months</strong>!</p>
+                    <p>Consider building a bigger emergency fund or adjusting your timeline.</p>
+                </div>
+                """, unsafe_allow_html=True)
         
-        months = list(range(1, 61))
-        base_prob = success_rate
-        probabilities = [max(10, base_prob - (m * 0.3) + random.uniform(-2, 2)) for m in months]
+            st.markdown("### 📊 Success Probability Over Time")
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=months, y=probabilities,
-            mode='lines+markers',
-            line=dict(color='#667eea', width=3),
-            marker=dict(size=4),
-            fill='tozeroy',
-            fillcolor='rgba(102, 126, 234, 0.2)'
-        ))
-        fig.update_layout(
-            title="Your Financial Success Probability (Next 5 Years)",
-            xaxis_title="Months",
-            yaxis_title="Success Probability (%)",
-            template="plotly_white",
-            height=400
-        )
-        st.plotly_chart(fig, use_container_width=True)
+            # Figures are cached per whole-percent rate; plotly_chart takes the dict as is
+            st.plotly_chart(_success_figure(round(success_rate)), use_container_width=True)
         
-        st.markdown("### 🌊 Ripple Effects of Your Choices")
-        for event, impacts in selected_events:
-            expense_emoji = "📈" if impacts['expense_change'] > 0 else "📉"
-            stability_emoji = "✅" if impacts['income_stability'] > 0 else "⚠️"
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); padding: 1rem; border-radius: 10px; margin: 0.5rem 0; color: #2d3748;'>
-                <strong>{event}</strong> → 
-                {expense_emoji} Expenses {'+' if impacts['expense_change'] > 0 else ''}{impacts['expense_change']*100:.0f}% | 
-                {stability_emoji} Income Stability {'+' if impacts['income_stability'] > 0 else ''}{impacts['income_stability']*100:.0f}% | 
-                📅 Timeline: {impacts['timeline']}
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        st.info("👆 Select life events above to see how they'll impact your financial future!")
+            st.markdown("### 🌊 Ripple Effects of Your Choices")
+            html_parts = []
+            for event, expense_change, income_stability, _, timeline in selected_events:
+                expense_emoji = "📈" if expense_change > 0 else "📉"
+                stability_emoji = "✅" if income_stability > 0 else "⚠️"
+                html_parts.append(_RIPPLE_TMPL % (event, expense_emoji, expense_change * 100,
+                                                  stability_emoji, income_stability * 100, timeline))
+            _card_stack(html_parts)
+        else:
+            st.info("👆 Select life events above and hit Analyze to see how they'll impact your financial future!")
+        
+        if st.toggle("🧪 Scenario Explorer: test every combination of events", key="whatif_explorer"):
+            # Every subset of events as one row of bits, scored in a single vectorized pass
+            n_events = len(_LIFE_EVENTS)
+            masks = (np.arange(1 << n_events)[:, None] >> np.arange(n_events)) & 1
+            success_rates, months_to_broke, _ = _score_scenarios(_EVENT_IMPACTS, masks, monthly_income)
+            breaking = (masks.sum(axis=1) >= 2) & (months_to_broke < 24)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Combinations Tested", f"{len(masks):,}")
+            with col2:
+                st.metric("Hit a Breaking Point", f"{int(breaking.sum()):,}")
+            
+            riskiest = np.argsort(success_rates, kind="stable")[:5]
+            st.dataframe(pd.DataFrame({
+                "Events": [" + ".join(_LIFE_EVENTS[j][0] for j in np.flatnonzero(masks[i])) or "None" for i in riskiest],
+                "Success Rate": [f"{rate}%" for rate in success_rates[riskiest]],
+                "Months to Broke": [f"{m:.0f}" if m < 999 else "Never" for m in months_to_broke[riskiest]],
+            }), use_container_width=True, hide_index=True)
+    
+    _render_whatif_analysis(monthly_income)
 
 # =============================================================================
 # FEATURE 7: FUTURE EXPENSE FORECASTING (EXPENSE ARCHAEOLOGY)
 # =============================================================================
 elif current_page == "🔍 Expense Forecasting":
     st.markdown("""
-    <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 2rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;'>
+    <div class='page-banner' style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);'>
         <h1 style='color: white; margin: 0;'>🔍 Expense Archaeology</h1>
         <p style='color: rgba(255,255,255,0.9); font-size: 1.2rem;'>Discover hidden money leaks & forgotten subscriptions</p>
     </div>
@@ -3734,65 +4476,29 @@ elif current_page == "🔍 Expense Forecasting":
         </div>
         """, unsafe_allow_html=True)
         
-        patterns = [
-            {"pattern": "Friday Night Splurge", "amount": 180, "frequency": "Weekly", "trend": "📈 +12% this month"},
-            {"pattern": "End of Month YOLO", "amount": 450, "frequency": "Monthly", "trend": "📈 +8% vs last month"},
-            {"pattern": "Payday Celebration", "amount": 320, "frequency": "Bi-weekly", "trend": "📉 -5% (improving!)"},
-            {"pattern": "Late Night Shopping", "amount": 95, "frequency": "3x/week", "trend": "📈 +23% (uh oh!)"}
-        ]
-        
-        for p in patterns:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.3rem; border-radius: 12px; margin: 0.7rem 0; box-shadow: 0 4px 12px rgba(0,0,0,0.15);'>
-                <div style='color: white; font-weight: 700; font-size: 1.1rem;'>{p['pattern']}</div>
-                <div style='color: #FFE8E8; font-size: 1.3rem; font-weight: 800; margin: 0.5rem 0;'>${p['amount']}</div>
-                <div style='color: rgba(255,255,255,0.9); font-size: 0.95rem;'>{p['frequency']} | {p['trend']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        _card_stack(_pattern_cards_html(_PATTERN_NAMES, _PATTERN_AMOUNTS, _PATTERN_FREQUENCIES, _PATTERN_TRENDS))
     
     with col2:
         st.markdown("### 💀 Subscription Graveyard")
         st.markdown("*Where forgotten money goes to die...*")
         
-        subscriptions = [
-            {"name": "Netflix", "cost": 15.99, "last_used": "2 weeks ago", "worth_it": True},
-            {"name": "Spotify Premium", "cost": 9.99, "last_used": "Yesterday", "worth_it": True},
-            {"name": "Adobe Creative Cloud", "cost": 54.99, "last_used": "3 months ago", "worth_it": False},
-            {"name": "ChatGPT Pro", "cost": 20.00, "last_used": "Today", "worth_it": True},
-            {"name": "Gym Membership", "cost": 49.99, "last_used": "6 months ago", "worth_it": False},
-            {"name": "iCloud Storage", "cost": 2.99, "last_used": "Daily (auto)", "worth_it": True},
-            {"name": "LinkedIn Premium", "cost": 29.99, "last_used": "2 months ago", "worth_it": False},
-            {"name": "Headspace", "cost": 12.99, "last_used": "1 month ago", "worth_it": False}
-        ]
-        
-        total_subs = sum(s['cost'] for s in subscriptions)
-        wasted = sum(s['cost'] for s in subscriptions if not s['worth_it'])
         
         st.markdown(f"""
         <div style='background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-bottom: 1rem;'>
             <h3>💸 Total Monthly Subscriptions</h3>
-            <h1 style='font-size: 3rem; margin: 0;'>${total_subs:.2f}</h1>
-            <p>= <strong>${total_subs * 12:.2f}/year</strong> draining from your account</p>
+            <h1 style='font-size: 3rem; margin: 0;'>${_TOTAL_SUBS:.2f}</h1>
+            <p>= <strong>${_TOTAL_SUBS * 12:.2f}/year</strong> draining from your account</p>
         </div>
         """, unsafe_allow_html=True)
         
-        for sub in subscriptions:
-            status = "🟢" if sub['worth_it'] else "🔴"
-            cancel_btn = "" if sub['worth_it'] else " [CANCEL?]"
-            bg_gradient = "linear-gradient(135deg, #51cf66 0%, #40c057 100%)" if sub['worth_it'] else "linear-gradient(135deg, #ff6b6b 0%, #ff5252 100%)"
-            text_color = "white"
-            st.markdown(f"""
-            <div style='background: {bg_gradient}; padding: 1rem; border-radius: 10px; margin: 0.4rem 0; color: {text_color}; box-shadow: 0 3px 8px rgba(0,0,0,0.1);'>
-                {status} <strong style='font-size: 1.1rem;'>{sub['name']}</strong><br/>
-                <span style='font-size: 1.2rem; font-weight: 700;'>${sub['cost']}/mo</span> | Last used: {sub['last_used']}<span style='font-weight: bold;'>{cancel_btn}</span>
-            </div>
-            """, unsafe_allow_html=True)
+        _card_stack(_subscription_card_html(name, cost, last_used, worth_it)
+                    for name, cost, last_used, worth_it in zip(_SUB_NAMES, _SUB_COSTS, _SUB_LAST_USED, _SUB_WORTH))
         
-        if wasted > 0:
+        if _WASTED > 0:
             st.markdown(f"""
             <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-top: 1rem;'>
                 <h3>💰 Cancel unused subscriptions to save:</h3>
-                <h1 style='font-size: 2.5rem; margin: 0;'>${wasted * 12:.2f}/year</h1>
+                <h1 style='font-size: 2.5rem; margin: 0;'>${_WASTED * 12:.2f}/year</h1>
                 <button style='background: white; color: #11998e; border: none; padding: 10px 25px; border-radius: 25px; font-weight: bold; margin-top: 10px; cursor: pointer;'>
                     🗑️ Review & Cancel Now
                 </button>
@@ -3802,170 +4508,112 @@ elif current_page == "🔍 Expense Forecasting":
     st.markdown("---")
     st.markdown("### 🚨 Anomaly Alarm")
     
-    anomalies = [
-        {"category": "Groceries", "normal": 450, "current": 630, "change": 40, "reason": "Inflation or behavior change?"},
-        {"category": "Dining Out", "normal": 200, "current": 380, "change": 90, "reason": "Dating season? 💕"},
-        {"category": "Transport", "normal": 150, "current": 220, "change": 47, "reason": "Gas prices or more trips?"}
-    ]
-    
-    cols = st.columns(3)
-    for i, anomaly in enumerate(anomalies):
-        with cols[i]:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center;'>
-                <h4>{anomaly['category']}</h4>
-                <p style='margin: 0;'>Normal: ${anomaly['normal']}</p>
-                <h2 style='margin: 0.5rem 0;'>Now: ${anomaly['current']}</h2>
-                <p style='font-size: 1.5rem; margin: 0;'>📈 +{anomaly['change']}%</p>
-                <p style='opacity: 0.9; font-size: 0.9rem;'>{anomaly['reason']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+    _card_row(_anomaly_cards_html(_ANOMALY_CATEGORIES, _ANOMALY_NORMAL, _ANOMALY_CURRENT,
+                                  _ANOMALY_CHANGE, _ANOMALY_REASONS), 3)
     
     st.markdown("### 🪣 The Leaky Bucket")
     st.markdown("*Watch your money drip away through forgotten subscriptions...*")
     
-    fig = go.Figure(go.Funnel(
-        y = ["Income", "After Bills", "After Subscriptions", "After Hidden Leaks", "What's Left"],
-        x = [5000, 3500, 3300, 2800, 2500],
-        textposition = "inside",
-        textinfo = "value+percent initial",
-        marker=dict(color=["#667eea", "#764ba2", "#f093fb", "#f5576c", "#11998e"])
-    ))
-    fig.update_layout(title="Where Does Your Money Go?", height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_leaky_bucket_figure(), use_container_width=True)
 
 # =============================================================================
 # FEATURE 8: INCOME STABILITY ANALYZER
 # =============================================================================
 elif current_page == "🏦 Income Analyzer":
     st.markdown("""
-    <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 2rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;'>
+    <div class='page-banner' style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);'>
         <h1 style='color: white; margin: 0;'>🏦 Income Stability Analyzer</h1>
         <p style='color: rgba(255,255,255,0.9); font-size: 1.2rem;'>Bank Loan Eligibility + Gig Economy Readiness Check</p>
     </div>
     """, unsafe_allow_html=True)
     
-    st.markdown("### 📊 Your Income Profile")
-    
-    col1, col2, col3 = st.columns(3)
+    @st.fragment
+    def _render_income_analyzer():
+        """Income profile inputs and everything derived from them, rerun on their own"""
+        st.markdown("### 📊 Your Income Profile")
     
-    with col1:
-        income_type = st.selectbox("Income Type", ["Full-time Salary", "Freelance/Gig", "Mixed Income", "Business Owner"])
-    with col2:
-        monthly_income = st.number_input("Average Monthly Income", min_value=0, value=5000, step=500)
-    with col3:
-        income_variance = st.slider("Income Variance (%)", 0, 100, 15, help="How much does your income fluctuate month-to-month?")
+        col1, col2, col3 = st.columns(3)
     
-    stability_base = {
-        "Full-time Salary": 85,
-        "Freelance/Gig": 45,
-        "Mixed Income": 65,
-        "Business Owner": 55
-    }
+        with col1:
+            income_type = st.selectbox("Income Type", _INCOME_TYPES)
+        with col2:
+            monthly_income = st.number_input("Average Monthly Income", min_value=0, value=5000, step=500)
+        with col3:
+            income_variance = st.slider("Income Variance (%)", 0, 100, 15, help="How much does your income fluctuate month-to-month?")
     
-    stability_score = max(0, min(100, stability_base[income_type] - (income_variance * 0.5)))
+        stability_score = max(0, min(100, _STABILITY_BASE[_INCOME_TYPES.index(income_type)] - (income_variance * 0.5)))
     
-    st.markdown("---")
+        st.markdown("---")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("### 📋 Your Income Report Card")
+        with col1:
+            st.markdown("### 📋 Your Income Report Card")
         
-        grade = "A+" if stability_score >= 90 else "A" if stability_score >= 80 else "B+" if stability_score >= 70 else "B" if stability_score >= 60 else "C+" if stability_score >= 50 else "C" if stability_score >= 40 else "D"
+            grade = _GRADE_LABELS[bisect_right(_GRADE_THRESHOLDS, stability_score)]
         
-        grade_color = "#11998e" if stability_score >= 70 else "#f39c12" if stability_score >= 50 else "#e74c3c"
+            grade_color, loan_multiple, loan_message = _LOAN_TIERS[bisect_right(_LOAN_THRESHOLDS, stability_score)]
         
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, {grade_color} 0%, {grade_color}aa 100%); padding: 2rem; border-radius: 20px; color: white; text-align: center;'>
-            <h2>Income Stability Grade</h2>
-            <h1 style='font-size: 6rem; margin: 0;'>{grade}</h1>
-            <h3>Score: {stability_score:.0f}/100</h3>
-        </div>
-        """, unsafe_allow_html=True)
+            st.markdown(_grade_card_html(grade, grade_color, round(stability_score)), unsafe_allow_html=True)
         
-        st.markdown("### 💳 How Much Can You Safely Borrow?")
+            st.markdown("### 💳 How Much Can You Safely Borrow?")
         
-        if stability_score >= 70:
-            max_loan = monthly_income * 48
-            loan_message = "Banks love you! High stability = great loan terms"
-        elif stability_score >= 50:
-            max_loan = monthly_income * 24
-            loan_message = "Decent borrowing power, but rates may be higher"
-        else:
-            max_loan = monthly_income * 12
-            loan_message = "Limited borrowing power - consider building stability first"
+            max_loan = monthly_income * loan_multiple
         
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center; margin-top: 1rem;'>
-            <h3>Safe Borrowing Limit</h3>
-            <h1 style='font-size: 2.5rem; margin: 0;'>{format_currency(max_loan, 0)}</h1>
-            <p style='opacity: 0.9;'>{loan_message}</p>
-        </div>
-        """, unsafe_allow_html=True)
+            st.markdown(_loan_card_html(max_loan, loan_message, st.session_state.currency), unsafe_allow_html=True)
     
-    with col2:
-        st.markdown("### 🚀 Gig Economy Readiness Check")
+        with col2:
+            st.markdown("### 🚀 Gig Economy Readiness Check")
         
-        emergency_needed = monthly_income * 6
-        current_emergency = st.number_input("Current Emergency Fund", min_value=0, value=int(monthly_income * 2), step=1000)
-        emergency_progress = (current_emergency / emergency_needed) * 100 if emergency_needed > 0 else 0
+            emergency_needed = monthly_income * 6
+            current_emergency = st.number_input("Current Emergency Fund", min_value=0, value=int(monthly_income * 2), step=1000)
+            emergency_progress = (current_emergency / emergency_needed) * 100 if emergency_needed > 0 else 0
         
-        if income_type == "Full-time Salary":
-            st.markdown(f"""
-            <div style='background: #fff3cd; padding: 1.5rem; border-radius: 15px; color: #856404; margin-bottom: 1rem;'>
-                <h4>🤔 Thinking of Going Freelance?</h4>
-                <p>You need <strong>{format_currency(emergency_needed, 0)}</strong> emergency fund</p>
-                <p>Currently have: <strong>{format_currency(current_emergency, 0)}</strong> ({emergency_progress:.0f}%)</p>
-                <div style='background: #ffc107; height: 20px; border-radius: 10px; overflow: hidden;'>
-                    <div style='background: #28a745; height: 100%; width: {min(100, emergency_progress)}%;'></div>
+            if income_type == "Full-time Salary":
+                st.markdown(f"""
+                <div style='background: #fff3cd; padding: 1.5rem; border-radius: 15px; color: #856404; margin-bottom: 1rem;'>
+                    <h4>🤔 Thinking of Going Freelance?</h4>
+                    <p>You need <strong>{format_currency(emergency_needed, 0)}</strong> emergency fund</p>
+                    <p>Currently have: <strong>{format_currency(current_emergency, 0)}</strong> ({emergency_progress:.0f}%)</p>
+                    <div style='background: #ffc107; height: 20px; border-radius: 10px; overflow: hidden;'>
+                        <div style='background: #28a745; height: 100%; width: {min(100, emergency_progress)}%;'></div>
+                    </div>
                 </div>
-            </div>
-            """, unsafe_allow_html=True)
+                """, unsafe_allow_html=True)
             
-            if emergency_progress < 100:
-                st.warning(f"⚠️ Your stability score is too low for freelancing. Recommendation: Build up {format_currency(emergency_needed - current_emergency, 0)} more in savings first!")
+                if emergency_progress < 100:
+                    st.warning(f"⚠️ Your stability score is too low for freelancing. Recommendation: Build up {format_currency(emergency_needed - current_emergency, 0)} more in savings first!")
+                else:
+                    st.success("✅ You're financially ready to explore freelancing!")
             else:
-                st.success("✅ You're financially ready to explore freelancing!")
-        else:
-            st.info("You're already in the gig economy! Focus on building that emergency fund.")
+                st.info("You're already in the gig economy! Focus on building that emergency fund.")
         
-        st.markdown("### 📈 Income Forecast (6 months)")
+            st.markdown("### 📈 Income Forecast (6 months)")
         
-        months = ['Month 1', 'Month 2', 'Month 3', 'Month 4', 'Month 5', 'Month 6']
-        if income_type == "Full-time Salary":
-            forecast = [monthly_income * (1 + random.uniform(-0.02, 0.03)) for _ in months]
-            trend = "Stable - Predictable growth trajectory"
-        else:
-            forecast = [monthly_income * (1 + random.uniform(-0.3, 0.4)) for _ in months]
-            trend = "Variable - High volatility expected"
+            st.plotly_chart(_income_forecast_figure(income_type, monthly_income), use_container_width=True)
         
-        fig = go.Figure()
-        fig.add_trace(go.Bar(x=months, y=forecast, marker_color='#667eea'))
-        fig.add_hline(y=monthly_income, line_dash="dash", line_color="red", annotation_text="Average")
-        fig.update_layout(title=f"Projected Income: {trend}", height=300, template="plotly_white")
-        st.plotly_chart(fig, use_container_width=True)
+            st.markdown("### 💪 Salary Negotiation Power")
         
-        st.markdown("### 💪 Salary Negotiation Power")
+            negotiation_power, salary_multiple = _NEGOTIATION_TIERS[bisect_right(_NEGOTIATION_THRESHOLDS, stability_score)]
+            safe_salary_demand = monthly_income * salary_multiple
         
-        negotiation_power = "HIGH" if stability_score >= 75 else "MEDIUM" if stability_score >= 50 else "LOW"
-        safe_salary_demand = monthly_income * (1.15 if negotiation_power == "HIGH" else 1.10 if negotiation_power == "MEDIUM" else 1.05)
-        
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center;'>
-            <h3>Your Negotiation Power: {negotiation_power}</h3>
-            <p>Based on your stability, you can safely demand:</p>
-            <h2>{format_currency(safe_salary_demand, 0)}/month</h2>
-            <p style='opacity: 0.8;'>(+{((safe_salary_demand/monthly_income)-1)*100:.0f}% from current)</p>
-        </div>
-        """, unsafe_allow_html=True)
+            st.markdown(f"""
+            <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 1.5rem; border-radius: 15px; color: white; text-align: center;'>
+                <h3>Your Negotiation Power: {negotiation_power}</h3>
+                <p>Based on your stability, you can safely demand:</p>
+                <h2>{format_currency(safe_salary_demand, 0)}/month</h2>
+                <p style='opacity: 0.8;'>(+{((safe_salary_demand/monthly_income)-1)*100:.0f}% from current)</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    _render_income_analyzer()
 
 # =============================================================================
 # FEATURE 9: LIFESTYLE INFLATION DETECTOR
 # =============================================================================
 elif current_page == "📈 Inflation Detector":
     st.markdown("""
-    <div style='background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%); padding: 2rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;'>
+    <div class='page-banner' style='background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%);'>
         <h1 style='color: white; margin: 0;'>📈 Lifestyle Inflation Detector</h1>
         <p style='color: rgba(255,255,255,0.9); font-size: 1.2rem;'>The 5-Year Broke Clock - How fast are you draining your future?</p>
     </div>
@@ -3973,167 +4621,80 @@ elif current_page == "📈 Inflation Detector":
     
     monthly_income = st.session_state.financial_profile.get('monthly_income', 5000) if st.session_state.financial_profile else 5000
     
-    col1, col2 = st.columns([2, 1])
+    @st.fragment
+    def _render_inflation_detector(monthly_income):
+        """Growth sliders, broke clock, inflation cap and gauge, rerun on their own"""
+        col1, col2 = st.columns([2, 1])
     
-    with col1:
-        st.markdown("### ⏰ Your 5-Year Broke Clock")
+        with col1:
+            st.markdown("### ⏰ Your 5-Year Broke Clock")
         
-        income_growth = st.slider("Your Income Growth Rate (%/year)", 0, 20, 5)
-        spending_growth = st.slider("Your Spending Growth Rate (%/year)", 0, 30, 15)
+            income_growth = st.slider("Your Income Growth Rate (%/year)", 0, 20, 5)
+            spending_growth = st.slider("Your Spending Growth Rate (%/year)", 0, 30, 15)
+            # The growth gap is derived once here and shared by the clock and the cap below
+            detected_inflation = max(0, spending_growth - income_growth)
         
-        if spending_growth > income_growth:
-            deficit_rate = spending_growth - income_growth
-            years_to_broke = min(10, 100 / deficit_rate) if deficit_rate > 0 else 999
-            
-            clock_color = "#ff416c" if years_to_broke < 3 else "#f39c12" if years_to_broke < 5 else "#11998e"
-            
-            st.markdown(f"""
-            <div style='background: {clock_color}; padding: 3rem; border-radius: 20px; color: white; text-align: center;'>
-                <h2>⏰ TIME UNTIL BROKE</h2>
-                <h1 style='font-size: 5rem; margin: 0;'>{years_to_broke:.1f}</h1>
-                <h2>YEARS</h2>
-                <p style='opacity: 0.9;'>At current spending trajectory</p>
-            </div>
-            """, unsafe_allow_html=True)
+            if detected_inflation > 0:
+                years_to_broke = min(10, 100 / detected_inflation)
             
-            years = list(range(0, 6))
-            status_labels = ["Now (Fine)", "Year 1", "Year 2 (Stress)", "Year 3 (Crisis)", "Year 4", "Year 5 (Broke?)"]
-            wealth = [monthly_income * 12 * 0.2]
+                clock_color = "#ff416c" if years_to_broke < 3 else "#f39c12" if years_to_broke < 5 else "#11998e"
             
-            for y in range(1, 6):
-                income = monthly_income * 12 * ((1 + income_growth/100) ** y)
-                spending = monthly_income * 12 * 0.8 * ((1 + spending_growth/100) ** y)
-                net = income - spending
-                wealth.append(wealth[-1] + net)
+                st.markdown(_CLOCK_TMPL.format(color=clock_color, years=years_to_broke), unsafe_allow_html=True)
             
-            fig = go.Figure()
-            colors = ['#11998e' if w > 0 else '#ff416c' for w in wealth]
-            fig.add_trace(go.Bar(x=status_labels, y=wealth, marker_color=colors))
-            fig.add_hline(y=0, line_color="red", line_width=3)
-            fig.update_layout(title="Your Wealth Journey", height=350, template="plotly_white")
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.success("🎉 Great news! Your income is growing faster than your spending. You're on track!")
+                st.plotly_chart(_wealth_journey_figure(monthly_income, income_growth, spending_growth),
+                                use_container_width=True, config=_STATIC_CHART_CONFIG, key="wealth_journey")
+            else:
+                st.success("🎉 Great news! Your income is growing faster than your spending. You're on track!")
     
-    with col2:
-        st.markdown("### 🔥 Category Inflation Breakdown")
-        st.markdown("*Which category is killing you?*")
-        
-        categories = [
-            {"name": "🍕 Food", "inflation": 12, "status": "danger"},
-            {"name": "🎬 Entertainment", "inflation": 8, "status": "warning"},
-            {"name": "📱 Subscriptions", "inflation": 15, "status": "danger"},
-            {"name": "👗 Shopping", "inflation": 20, "status": "danger"},
-            {"name": "🚗 Transport", "inflation": 5, "status": "ok"},
-            {"name": "🏠 Housing", "inflation": 3, "status": "ok"}
-        ]
+        with col2:
+            st.markdown("### 🔥 Category Inflation Breakdown")
+            st.markdown("*Which category is killing you?*")
         
-        for cat in categories:
-            if cat['status'] == 'danger':
-                bg = "linear-gradient(135deg, #ff6b6b 0%, #ff5252 100%)"
-                text_color = "white"
-            elif cat['status'] == 'warning':
-                bg = "linear-gradient(135deg, #ffa500 0%, #ffb84d 100%)"
-                text_color = "white"
-            else:
-                bg = "linear-gradient(135deg, #51cf66 0%, #40c057 100%)"
-                text_color = "white"
-            
-            icon = "🔴" if cat['status'] == 'danger' else "🟡" if cat['status'] == 'warning' else "🟢"
-            st.markdown(f"""
-            <div style='background: {bg}; padding: 1.2rem; border-radius: 12px; margin: 0.8rem 0; box-shadow: 0 4px 12px rgba(0,0,0,0.1);'>
-                <div style='color: {text_color}; font-size: 1.1rem; font-weight: 600;'>
-                    {icon} <strong>{cat['name']}</strong>: <span style='font-size: 1.3rem; font-weight: 700;'>+{cat['inflation']}%/year</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            _card_stack(_INFLATION_CATEGORY_CARDS)
         
-        worst_category = max(categories, key=lambda x: x['inflation'])
-        monthly_save = monthly_income * (worst_category['inflation'] / 100) * 0.5 / 12
+            monthly_save = monthly_income * (_WORST_INFLATION_CATEGORY.inflation / 100) * 0.5 / 12
         
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 1rem; border-radius: 15px; color: white; text-align: center; margin-top: 1rem;'>
-            <h4>💡 Quick Fix</h4>
-            <p>Cut {worst_category['name']} by 50%</p>
-            <h3>Save {format_currency(monthly_save, 0)}/mo</h3>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    st.markdown("### 🎛️ Auto-Tightening Cap (Behavioral Economics)")
+            st.markdown(_QUICK_FIX_TMPL.format(category=_WORST_INFLATION_CATEGORY.name, save=format_currency(monthly_save, 0)),
+                        unsafe_allow_html=True)
     
-    detected_inflation = spending_growth - income_growth if spending_growth > income_growth else 0
+        st.markdown("---")
+        st.markdown("### 🎛️ Auto-Tightening Cap (Behavioral Economics)")
     
-    if detected_inflation > 0:
-        current_fun_budget = monthly_income * 0.3
-        suggested_cap = current_fun_budget * (1 - detected_inflation / 100)
+        if detected_inflation > 0:
+            current_fun_budget = monthly_income * 0.3
+            suggested_cap = current_fun_budget * (1 - detected_inflation / 100)
         
-        col1, col2, col3 = st.columns(3)
+            col1, col2, col3 = st.columns(3)
         
-        with col1:
-            st.markdown(f"""
-            <div style='background: #f8f9fa; padding: 1.5rem; border-radius: 15px; text-align: center;'>
-                <h4>Current Fun Budget</h4>
-                <h2>{format_currency(current_fun_budget, 0)}</h2>
-            </div>
-            """, unsafe_allow_html=True)
+            with col1:
+                st.markdown(_FUN_BUDGET_TMPL.format(budget=format_currency(current_fun_budget, 0)), unsafe_allow_html=True)
         
-        with col2:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 1.5rem; border-radius: 15px; text-align: center; color: white;'>
-                <h4>Suggested New Cap</h4>
-                <h2>{format_currency(suggested_cap, 0)}</h2>
-                <p style='opacity: 0.8;'>(-{detected_inflation:.0f}% reduction)</p>
-            </div>
-            """, unsafe_allow_html=True)
+            with col2:
+                st.markdown(_NEW_CAP_TMPL.format(cap=format_currency(suggested_cap, 0), reduction=detected_inflation),
+                            unsafe_allow_html=True)
         
-        with col3:
-            accept_cap = st.button("✅ Accept New Budget", type="primary", use_container_width=True)
-            override = st.button("⚠️ Override (Not Recommended)", use_container_width=True)
+            with col3:
+                accept_cap = st.button("✅ Accept New Budget", type="primary", use_container_width=True)
+                override = st.button("⚠️ Override (Not Recommended)", use_container_width=True)
             
-            if override:
-                st.warning("💔 Are you sure? This breaks your 5-year plan and puts your financial future at risk!")
-    else:
-        st.info("🎉 No lifestyle inflation detected! You're living within your means.")
+                if override:
+                    st.warning("💔 Are you sure? This breaks your 5-year plan and puts your financial future at risk!")
+        else:
+            st.info("🎉 No lifestyle inflation detected! You're living within your means.")
     
-    st.markdown("### 🚗 Inflation Speed Gauge")
+        st.markdown("### 🚗 Inflation Speed Gauge")
     
-    speed = spending_growth
-    zone = "CRASH ZONE 💥" if speed > 15 else "DANGER ZONE ⚠️" if speed > 10 else "CAUTION 🟡" if speed > 5 else "SAFE ZONE ✅"
-    gauge_color = "#ff416c" if speed > 15 else "#f39c12" if speed > 10 else "#ffc107" if speed > 5 else "#11998e"
+        st.plotly_chart(_inflation_gauge_figure(spending_growth, income_growth), use_container_width=True,
+                        config=_STATIC_CHART_CONFIG, key="inflation_gauge")
     
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number+delta",
-        value = speed,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': f"Spending Inflation Rate<br><span style='font-size:0.8em;color:{gauge_color}'>{zone}</span>"},
-        delta = {'reference': income_growth, 'relative': False, 'position': "bottom"},
-        gauge = {
-            'axis': {'range': [0, 30], 'tickwidth': 1},
-            'bar': {'color': gauge_color},
-            'bgcolor': "white",
-            'steps': [
-                {'range': [0, 5], 'color': '#e8f5e9'},
-                {'range': [5, 10], 'color': '#fff3e0'},
-                {'range': [10, 15], 'color': '#ffebee'},
-                {'range': [15, 30], 'color': '#ffcdd2'}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': income_growth
-            }
-        }
-    ))
-    fig.update_layout(height=350)
-    st.plotly_chart(fig, use_container_width=True)
+    _render_inflation_detector(monthly_income)
 
 # =============================================================================
 # FEATURE 10: FINANCIAL STRESS PREDICTOR
 # =============================================================================
 elif current_page == "🧠 Stress Predictor":
     st.markdown("""
-    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 2rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;'>
+    <div class='page-banner' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);'>
         <h1 style='color: white; margin: 0;'>🧠 Financial Stress Predictor</h1>
         <p style='color: rgba(255,255,255,0.9); font-size: 1.2rem;'>Predict stress BEFORE it happens. Prepare NOW.</p>
     </div>
@@ -4144,32 +4705,8 @@ elif current_page == "🧠 Stress Predictor":
     st.markdown("### 📅 Stress Heat Map Calendar")
     st.markdown("*Color-coded months: 🟢 Chill → 🟡 Mild → 🔴 Stressful*")
     
-    months_data = {
-        "January": {"stress": 65, "reasons": ["New Year spending hangover", "Holiday credit card bills"], "color": "#f39c12"},
-        "February": {"stress": 45, "reasons": ["Valentine's Day expenses", "Tax prep stress"], "color": "#f1c40f"},
-        "March": {"stress": 40, "reasons": ["Spring break temptation", "End of Q1"], "color": "#2ecc71"},
-        "April": {"stress": 80, "reasons": ["TAX DEADLINE 📋", "Spring shopping"], "color": "#e74c3c"},
-        "May": {"stress": 55, "reasons": ["Mother's Day", "Wedding season starts"], "color": "#f39c12"},
-        "June": {"stress": 50, "reasons": ["Summer vacation planning", "Mid-year review"], "color": "#f1c40f"},
-        "July": {"stress": 45, "reasons": ["Summer activities", "Holiday spending"], "color": "#2ecc71"},
-        "August": {"stress": 60, "reasons": ["Back to school", "End of summer splurge"], "color": "#f39c12"},
-        "September": {"stress": 35, "reasons": ["Fresh start energy", "Fall reset"], "color": "#2ecc71"},
-        "October": {"stress": 55, "reasons": ["Halloween prep", "Holiday planning starts"], "color": "#f39c12"},
-        "November": {"stress": 75, "reasons": ["Black Friday FOMO", "Thanksgiving travel"], "color": "#e74c3c"},
-        "December": {"stress": 90, "reasons": ["Holiday shopping madness", "Year-end expenses", "Travel costs"], "color": "#e74c3c"}
-    }
-    
-    cols = st.columns(6)
-    for i, (month, data) in enumerate(months_data.items()):
-        with cols[i % 6]:
-            stress_emoji = "🔴" if data['stress'] >= 70 else "🟡" if data['stress'] >= 50 else "🟢"
-            st.markdown(f"""
-            <div style='background: {data['color']}; padding: 1rem; border-radius: 10px; text-align: center; color: white; margin: 0.3rem 0; min-height: 100px;'>
-                <strong>{month[:3]}</strong><br/>
-                <span style='font-size: 1.5rem;'>{stress_emoji}</span><br/>
-                <small>{data['stress']}%</small>
-            </div>
-            """, unsafe_allow_html=True)
+    # All twelve months go out as one 6-wide grid rather than a markdown call per cell
+    _card_row(_STRESS_MONTH_CARDS, 6)
     
     st.markdown("---")
     
@@ -4179,49 +4716,27 @@ elif current_page == "🧠 Stress Predictor":
         st.markdown("### 🔮 Why Will You Be Stressed?")
         st.markdown("*AI explains upcoming financial pressure points*")
         
-        current_month = datetime.now().strftime("%B")
-        next_stressful = None
-        
-        for month, data in months_data.items():
-            if data['stress'] >= 70:
-                next_stressful = (month, data)
-                break
+        next_stressful = _next_stressful_after(_NOW_MONTH)
         
         if next_stressful:
             month_name, data = next_stressful
             expected_cost = monthly_income * (data['stress'] / 100) * 1.5
             
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #ff416c 0%, #ff4b2b 100%); padding: 1.5rem; border-radius: 15px; color: white;'>
-                <h3>⚠️ {month_name} Stress Alert!</h3>
-                <p><strong>Expected extra expenses:</strong> {format_currency(expected_cost, 0)}</p>
-                <h4>Why?</h4>
-                <ul>
-                    {"".join(f"<li>{reason}</li>" for reason in data['reasons'])}
-                </ul>
-                <p style='opacity: 0.9;'>Your current savings may not cover this → Stress incoming!</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_STRESS_ALERT_TMPL.format(
+                month=month_name, cost=format_currency(expected_cost, 0),
+                reasons="".join(f"<li>{reason}</li>" for reason in data['reasons'])
+            ), unsafe_allow_html=True)
         
         st.markdown("### 📊 Vibe Check Trend")
         st.markdown("*Your emotional financial health over time*")
         
-        weeks = [f"Week {i}" for i in range(1, 13)]
-        stress_levels = [random.randint(30, 80) for _ in weeks]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=weeks, y=stress_levels,
-            mode='lines+markers',
-            line=dict(color='#667eea', width=3),
-            fill='tozeroy',
-            fillcolor='rgba(102, 126, 234, 0.2)'
-        ))
-        fig.add_hline(y=50, line_dash="dash", line_color="orange", annotation_text="Stress Threshold")
-        fig.update_layout(title="Your Stress Levels (Last 12 Weeks)", height=300, template="plotly_white")
-        st.plotly_chart(fig, use_container_width=True)
+        weeks = tuple(f"Week {i}" for i in range(1, 13))
+        week_stamp = int(_NOW.strftime("%Y%W"))
+        stress_levels = _stress_levels(week_stamp, len(weeks))
+        st.plotly_chart(_stress_trend_figure(week_stamp, weeks), use_container_width=True,
+                        config=_INTERACTIVE_CHART_CONFIG, key="stress_trend")
         
-        avg_stress = sum(stress_levels) / len(stress_levels)
+        avg_stress = stress_levels.mean()
         if avg_stress > 60:
             st.warning("📈 ML Finding: Your stress peaks when savings drop below $10,000. Build that buffer!")
         else:
@@ -4231,18 +4746,9 @@ elif current_page == "🧠 Stress Predictor":
         st.markdown("### 🛡️ Stress Prevention Mode")
         st.markdown("*Start preparing MONTHS before stress hits*")
         
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1rem;'>
-            <h4>🎄 December Fund Progress</h4>
-            <p>Target: {format_currency(monthly_income * 1.5, 0)} for holiday expenses</p>
-            <p>Start saving: <strong>November 1st</strong></p>
-            <p>Monthly contribution needed: <strong>{format_currency(monthly_income * 0.25, 0)}</strong></p>
-            <div style='background: rgba(255,255,255,0.3); height: 20px; border-radius: 10px; overflow: hidden; margin-top: 10px;'>
-                <div style='background: white; height: 100%; width: 35%;'></div>
-            </div>
-            <p style='text-align: center; margin-top: 5px;'>35% funded | 🎯 On Track!</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_DECEMBER_FUND_TMPL.format(
+            target=format_currency(monthly_income * 1.5, 0), monthly=format_currency(monthly_income * 0.25, 0)
+        ), unsafe_allow_html=True)
         
         st.markdown("### 💚 Emotional Intervention")
         st.markdown("*When stress is detected, we help immediately*")
@@ -4250,18 +4756,7 @@ elif current_page == "🧠 Stress Predictor":
         stress_detected = random.choice([True, False])
         
         if stress_detected:
-            st.markdown(f"""
-            <div style='background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); padding: 1.5rem; border-radius: 15px; color: #2d3748;'>
-                <h3>💬 Hey there! I detected some financial stress coming your way.</h3>
-                <p>Let's build a plan together. Here are some quick wins:</p>
-                <div style='background: white; padding: 1rem; border-radius: 10px; margin: 1rem 0;'>
-                    <p>☕ Skip 1 coffee this week = <strong>{format_currency(25, 0)}</strong> toward your goal</p>
-                    <p>🎬 Movie night at home instead = <strong>{format_currency(40, 0)}</strong> saved</p>
-                    <p>🍽️ Cook one extra meal = <strong>{format_currency(30, 0)}</strong> in your pocket</p>
-                </div>
-                <p style='text-align: center;'>Small actions = Big stress relief! 💪</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_intervention_card_html(st.session_state.currency), unsafe_allow_html=True)
         else:
             st.info("😌 No stress detected right now! You're doing great. Keep it up!")
         
@@ -4269,20 +4764,6 @@ elif current_page == "🧠 Stress Predictor":
         
         financial_wellness = random.randint(60, 90)
         
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number",
-            value = financial_wellness,
-            title = {'text': "Financial Wellness Score"},
-            gauge = {
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "#667eea"},
-                'steps': [
-                    {'range': [0, 40], 'color': "#ffcdd2"},
-                    {'range': [40, 70], 'color': "#fff9c4"},
-                    {'range': [70, 100], 'color': "#c8e6c9"}
-                ]
-            }
-        ))
-        fig.update_layout(height=250)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_wellness_gauge_figure(financial_wellness), use_container_width=True,
+                        config=_STATIC_CHART_CONFIG, key="wellness_gauge")
 